@@ -2,6 +2,7 @@ import asyncio
 from pathlib import Path
 from datetime import timedelta
 import time
+from itertools import chain
 from typing import Optional, Tuple
 import sys
 
@@ -44,6 +45,8 @@ class MainOrchestrator:
         except Exception as e:
             self.logger.critical(f"❌ Erro inesperado no gerenciamento de VPN: {e}")
             return False
+        finally:
+            await asyncio.to_thread(manager.close)
 
     async def _extract_step(self) -> Tuple[bool, Optional[Path]]:
         """Executa a extração (Scraper) e garante o fechamento do browser."""
@@ -57,31 +60,31 @@ class MainOrchestrator:
             await scraper.close()
     
     def _load_step(self, file_path: Path) -> bool:
-        """Executa Transformação (Pandas) e Carga (SQL)."""
+        """Executa Transformação (Pandas) e Carga (SQL) em blocos, sem materializar o Excel inteiro."""
 
         try:
-            # 1. Transformação
+            # 1. Transformação (sob demanda, bloco a bloco)
             handler = ExcelFileHandler()
 
             # Passa como parâmetro o file_path recebido da extração, eliminando a redundância de procurar o arquivo novamente.
-            result = handler.process_most_recent_file(file_path=file_path)
+            chunks = handler.iter_processed_chunks(file_path=file_path)
+            first_chunk = next(chunks, None)
 
-            if not result.success:
-                self.logger.error(f"❌ Falha no tratamento: {result.message}")
-                return False
-            
-            df = result.dataframe
-            self.logger.info(f"✅ Dados tratados com sucesso. Linhas: {len(df)}")
+            if first_chunk is None:
+                self.logger.warning("⚠️ Nenhuma linha elegível para carga no arquivo.")
+                handler.delete_most_recent_file(file_path=file_path)
+                return True
 
             # 2. Carga
             with PostgreSQLHandler(self.db_config) as db:
                 self.logger.info(f"✅ Conectado ao banco de dados: {self.db_config.dbname}")
 
                 if not db.table_exists(table_name):
-                    db.create_table_from_dataframe(df, table_name)
+                    db.create_table_from_dataframe(first_chunk, table_name)
                     self.logger.info(f"📋 Tabela '{table_name}' criada com base no DataFrame.")
                 
-                db.bulk_insert_dataframe(df, table_name)
+                total_rows = db.bulk_insert_chunks(chain([first_chunk], chunks), table_name)
+                self.logger.info(f"✅ Dados tratados com sucesso. Linhas: {total_rows}")
                 self.logger.info(f"🎉 Carga de dados concluída com sucesso na tabela: {table_name}")
                 
                 handler.delete_most_recent_file(file_path=file_path)
@@ -1,16 +1,45 @@
 from __future__ import annotations
 from dataclasses import dataclass
-import io
-from typing import Any, Optional, Iterable, Dict, TypeVar, List, Tuple
+from typing import Any, BinaryIO, Callable, Final, Optional, Iterable, Dict, TypeVar, List, Tuple
 import contextlib
+import functools
+import os
+import threading
 from .syslog import SystemLogger
 from .psw import host_ssl, dbname, user, password_db, schema
 
 import psycopg2
+import numpy as np
 import pandas as pd
 from psycopg2 import sql
-from psycopg2.extras import execute_batch, DictCursor
-from psycopg2.extensions import connection as PgConnection, cursor as PgCursor
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import execute_values, RealDictCursor
+from psycopg2.extensions import connection as PgConnection, cursor as PgCursor, register_adapter, AsIs, Float
+
+# pd.NA (colunas nullable como Int64) é enviado como NULL
+register_adapter(type(pd.NA), lambda _: AsIs('NULL'))
+
+# Escalares numpy (o itertuples devolve numpy.int64 em colunas Int64 sem nulos) são enviados como números
+for _np_type in (np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64):
+    register_adapter(_np_type, AsIs)
+
+for _np_type in (np.float16, np.float32, np.float64):
+    register_adapter(_np_type, lambda value: Float(float(value)))
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+
+    # Opções do writer CSV do Arrow para o COPY (lotes maiores = menos escritas no pipe)
+    _ARROW_CSV_OPTIONS = pa_csv.WriteOptions(include_header=False, delimiter='\t', batch_size=16_384)
+except ImportError: # pyarrow é opcional - sem ele o COPY usa o to_csv do pandas
+    pa = None
+    pc = None
+    pa_csv = None
+
+# Formato texto das datas gravadas (mesmo formato histórico das tabelas, em todos os caminhos de carga)
+_DATETIME_TEXT_FORMAT: Final[str] = '%Y-%m-%d %H:%M'
 
 # Configuração tipada para conexão
 @dataclass(frozen=True)
@@ -23,6 +52,146 @@ class PostgreSQLConfig:
     port: int = 5432
     connect_timeout: int = 20
     application_name: str = "PostgreSQLHandler"
+    pool_size: int = 5
+
+# Pools de conexão compartilhados, um por configuração (criados sob demanda)
+_POOLS: Dict[PostgreSQLConfig, ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+def _get_pool(config: PostgreSQLConfig) -> ThreadedConnectionPool:
+    """
+    Retorna o pool de conexões da configuração, criando-o na primeira chamada.
+
+    As configurações de sessão (fuso horário e search_path) são enviadas como
+    parâmetros de inicialização, aplicadas uma única vez por conexão física.
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(config)
+
+        if pool is None or pool.closed:
+            pool = ThreadedConnectionPool(
+                minconn=1,
+                maxconn=config.pool_size,
+                host=config.host,
+                dbname=config.dbname,
+                user=config.user,
+                password=config.password,
+                port=config.port,
+                connect_timeout=config.connect_timeout,
+                application_name=config.application_name,
+                options=f"-c TimeZone=UTC-3 -c search_path={config.schema},vivo"
+            )
+            _POOLS[config] = pool
+
+        return pool
+
+# Mapeamento de tipos do pandas para tipos do PostgreSQL (construído uma única vez)
+_PG_TYPE_MAP: Final[Dict[str, str]] = {
+    # Tipos numéricos
+    'int8': 'SMALLINT',
+    'int16': 'SMALLINT',
+    'int32': 'INTEGER',
+    'int64': 'BIGINT',
+    'uint8': 'SMALLINT',
+    'uint16': 'INTEGER',
+    'uint32': 'BIGINT',
+    'uint64': 'NUMERIC(20)',
+    'float16': 'REAL',
+    'float32': 'REAL',
+    'float64': 'DOUBLE PRECISION',
+
+    # Tipos numéricos nullable (pandas) e com backend pyarrow
+    'Int8': 'SMALLINT',
+    'Int16': 'SMALLINT',
+    'Int32': 'INTEGER',
+    'Int64': 'BIGINT',
+    'Float32': 'REAL',
+    'Float64': 'DOUBLE PRECISION',
+    'int8[pyarrow]': 'SMALLINT',
+    'int16[pyarrow]': 'SMALLINT',
+    'int32[pyarrow]': 'INTEGER',
+    'int64[pyarrow]': 'BIGINT',
+    'float[pyarrow]': 'REAL',
+    'double[pyarrow]': 'DOUBLE PRECISION',
+
+    # Tipos temporais
+    'datetime64[ns]': 'TIMESTAMP WITH TIME ZONE',
+    'timedelta64[ns]': 'INTERVAL',
+    'timestamp[ns][pyarrow]': 'TIMESTAMP WITH TIME ZONE',
+    'timestamp[us][pyarrow]': 'TIMESTAMP WITH TIME ZONE',
+    'duration[ns][pyarrow]': 'INTERVAL',
+
+    # Tipos booleanos
+    'bool': 'BOOLEAN',
+    'boolean': 'BOOLEAN',
+    'bool[pyarrow]': 'BOOLEAN',
+
+    # Tipos de texto (colunas só com nulos no Arrow viram null[pyarrow])
+    'object': 'TEXT',
+    'string': 'TEXT',
+    'string[pyarrow]': 'TEXT',
+    'large_string[pyarrow]': 'TEXT',
+    'null[pyarrow]': 'TEXT',
+
+    # Tipos binários
+    'bytes': 'BYTEA',
+}
+
+@functools.lru_cache(maxsize=64)
+def _build_insert_sql(schema: str, table: str, columns: Tuple[str, ...]) -> sql.Composed:
+    """Compõe (e memoriza) o INSERT multi-VALUES usado pelo execute_values."""
+    return sql.SQL("""
+        INSERT INTO {schema}.{table} ({columns})
+        VALUES %s
+    """).format(
+        schema=sql.Identifier(schema),
+        table=sql.Identifier(table),
+        columns=sql.SQL(', ').join(map(sql.Identifier, columns))
+    )
+
+@functools.lru_cache(maxsize=64)
+def _build_copy_sql(schema: str, table: str, columns: Tuple[str, ...]) -> sql.Composed:
+    """Compõe (e memoriza) o COPY ... FROM STDIN usado nas cargas em massa."""
+    # FORMAT CSV é mantido em vez de BINARY: o binário exige que cada campo
+    # tenha exatamente o tipo da coluna de destino (as tabelas existentes são
+    # TEXT) e a serialização já ocorre em C++ no Arrow, sem str() por célula.
+    return sql.SQL("COPY {schema}.{table} ({fields}) FROM STDIN WITH (FORMAT CSV, DELIMITER '\t', NULL '')").format(
+        schema=sql.Identifier(schema),
+        table=sql.Identifier(table),
+        fields=sql.SQL(', ').join(map(sql.Identifier, columns))
+    )
+
+def _null_mask(series: pd.Series) -> pd.Series:
+    """Máscara dos valores gravados como NULL: NaN/NaT/NA e as strings 'None' e '' das colunas de texto."""
+    mask = series.isna()
+
+    if pd.api.types.is_string_dtype(series.dtype):
+        mask |= series.isin(("None", ""))
+
+    return mask
+
+class _CopySource:
+    """
+    Leitura do pipe entregue ao copy_expert. Ao fim do fluxo aguarda a thread
+    de escrita e relança a falha dela, fazendo o psycopg2 abortar o COPY
+    (CopyFail) em vez de gravar um CSV truncado.
+    """
+
+    def __init__(self, source: BinaryIO, writer: threading.Thread, errors: List[BaseException]):
+        self._source = source
+        self._writer = writer
+        self._errors = errors
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+
+        if not data:
+            self._writer.join()
+
+            if self._errors:
+                raise self._errors[0]
+
+        return data
 
 T = TypeVar('T', bound='PostgreSQLHandler')
 
@@ -86,33 +255,19 @@ class PostgreSQLHandler:
             return
 
         try:
-            self._connection = psycopg2.connect(
-                host=self._config.host,
-                dbname=self._config.dbname,
-                user=self._config.user,
-                password=self._config.password,
-                port=self._config.port,
-                connect_timeout=self._config.connect_timeout,
-                application_name=self._config.application_name,
-                cursor_factory=DictCursor
-            )
+            self._connection = _get_pool(self._config).getconn()
             self._logger.info("✅ Conexão com o PostgreSQL estabelecida com sucesso.")
-
-            # Configurações recomendadas para performance
-            with self._connection.cursor() as cursor:
-                cursor.execute("SET TIME ZONE 'UTC-3'")
-                cursor.execute(f"SET search_path TO {self._config.schema}, vivo")
         
         except psycopg2.Error as e:
             self._logger.error(f"❌ Falha ao conectar ao PostgreSQL: {e}")
             raise psycopg2.OperationalError(f"Conexão falhou: {e}") from e
     
     def disconnect(self) -> None:
-        """Fecha a conexão com o banco de dados de forma segura."""
-        if self._connection is not None and not self._connection.closed:
+        """Devolve a conexão ao pool de forma segura (conexões fechadas são descartadas)."""
+        if self._connection is not None:
             try:
-                self._connection.close()
-                self._logger.info("✅ Conexão com o PostgreSQL encerrada.")
+                _get_pool(self._config).putconn(self._connection, close=bool(self._connection.closed))
+                self._logger.info("✅ Conexão com o PostgreSQL devolvida ao pool.")
             
             except psycopg2.Error as e:
                 self._logger.error(f"❌ Erro ao encerrar a conexão: {e}")
@@ -121,25 +276,34 @@ class PostgreSQLHandler:
                 self._connection = None
     
     @contextlib.contextmanager
-    def _get_cursor(self) -> Iterable[PgCursor]:
+    def _get_cursor(self, bulk_mode: bool = False, cursor_factory: Optional[type] = None) -> Iterable[PgCursor]:
         """
         Context manager para gerenciamento seguro de cursores.
+
+        Args:
+            bulk_mode: Se True, desativa o synchronous_commit apenas nesta transação
+                (o commit não aguarda o fsync do WAL, ideal para cargas em massa)
+            cursor_factory: Classe de cursor opcional (padrão: cursor de tuplas)
         
         Yields:
             PgCursor: Cursor configurado para operações no banco
             
         Raises:
-            psycopg2.Error: Em caso de erro no banco de dados
+            Exception: Qualquer erro no bloco é relançado após o rollback
         """
 
         cursor = None
 
         try:
-            cursor = self.connection.cursor ()
+            cursor = self.connection.cursor(cursor_factory=cursor_factory)
+
+            if bulk_mode:
+                cursor.execute("SET LOCAL synchronous_commit = off")
+
             yield cursor
             self.connection.commit()
 
-        except psycopg2.Error as e:
+        except Exception as e: # Qualquer falha (inclusive fora do psycopg2) desfaz a transação
             self.connection.rollback()
             self._logger.error(f"❌ Falha na operação do banco de dados: {e}")
             raise
@@ -148,8 +312,9 @@ class PostgreSQLHandler:
             if cursor is not None:
                 cursor.close()
 
-    def _map_pandas_to_postgres_type(self, dtype: str) -> str:
-         """
+    @staticmethod
+    def _map_pandas_to_postgres_type(dtype: str) -> str:
+        """
         Mapeia tipos do pandas para tipos do PostgreSQL de forma mais completa.
         
         Args:
@@ -159,36 +324,7 @@ class PostgreSQLHandler:
             str: Tipo correspondente no PostgreSQL
         """
 
-         type_mapping: Dict[str, str] = {
-            # Tipos numéricos
-            'int8': 'SMALLINT',
-            'int16': 'SMALLINT',
-            'int32': 'INTEGER',
-            'int64': 'BIGINT',
-            'uint8': 'SMALLINT',
-            'uint16': 'INTEGER',
-            'uint32': 'BIGINT',
-            'uint64': 'NUMERIC(20)',
-            'float16': 'REAL',
-            'float32': 'REAL',
-            'float64': 'DOUBLE PRECISION',
-
-            # Tipos temporais
-            'datetime64[ns]': 'TIMESTAMP WITH TIME ZONE',
-            'timedelta64[ns]': 'INTERVAL',
-
-            # Tipos booleanos
-            'bool': 'BOOLEAN',
-
-            # Tipos de texto
-            'object': 'TEXT',
-            'string': 'TEXT',
-
-            # Tipos binários
-            'bytes': 'BYTEA',                                                 
-         }
-
-         return type_mapping.get(str(dtype), 'TEXT')
+        return _PG_TYPE_MAP.get(dtype, 'TEXT')
     
     def _prepare_data_for_insert(self, df: pd.DataFrame) -> List[Tuple[Any, ...]]:
         """
@@ -200,11 +336,24 @@ class PostgreSQLHandler:
         Returns:
             List[Tuple]: Dados preparados como lista de tuplas
         """
-        # 1. Trata todos os valores NaN (incluindo NaT para datetime) e 'None' (string) para Python None     
-        df_clean = df.replace({pd.NA: None, pd.NaT: None, "None": None, "": None})
+        # 1. Formata as datas como texto e trata todos os valores NaN (incluindo NaT) e 'None' (string)
+        #    para Python None, com máscaras vetorizadas por coluna em vez de um replace célula a célula
+        df_clean = df.copy(deep=False)
+
+        for col in df_clean.columns:
+            series = df_clean[col]
+
+            if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                series = series.dt.strftime(_DATETIME_TEXT_FORMAT)
+                df_clean[col] = series
+
+            mask = _null_mask(series)
+
+            if mask.any():
+                df_clean[col] = series.astype(object).where(~mask, None)
 
         # 2. Converte o DataFrame limpo diretamente para uma lista de tuplas.
-        processed_data = [tuple(row) for row in df_clean.to_records(index=False)]
+        processed_data = list(df_clean.itertuples(index=False, name=None))
         
         return processed_data
     
@@ -269,8 +418,8 @@ class PostgreSQLHandler:
         
         columns_df = []
 
-        for col, dtype in df.dtypes.items():
-            pg_type = self._map_pandas_to_postgres_type(str(dtype))
+        for col, dtype in df.dtypes.astype(str).items():
+            pg_type = self._map_pandas_to_postgres_type(dtype)
             col_df = f'"{col}" {pg_type}'
             columns_df.append(col_df)
 
@@ -284,20 +433,18 @@ class PostgreSQLHandler:
             )
         """
         
+        # Cria índices se especificado (enviados junto com o CREATE TABLE em um único comando)
+        if indexes:
+            index_queries = [
+                f'CREATE INDEX IF NOT EXISTS idx_{table_name}_{col} ON {self._config.schema}.{table_name} ("{col}")'
+                for col in indexes
+            ]
+            query = ";\n".join([query, *index_queries])
+
         try:
             with self._get_cursor() as cursor:
                 cursor.execute(query)
 
-                # Cria índices se especificado
-                if indexes:
-                    for col in indexes:
-                        index_query = f"""
-                            CREATE INDEX IF NOT EXISTS 
-                            idx_{table_name}_{col} ON {self._config.schema}.{table_name} ("{col}")
-                        """
-                    
-                        cursor.execute(index_query)
-
             self._logger.info(f"✅ Tabela {self._config.schema}.{table_name} criada com sucesso.")
 
         except psycopg2.Error as e:
@@ -308,52 +455,61 @@ class PostgreSQLHandler:
             self,
             df: pd.DataFrame,
             table_name: str,
-            batch_size: int = 2000,
+            batch_size: Optional[int] = None,
             create_table: bool = False,
-            truncate: bool = False) -> int:
+            truncate: bool = False,
+            method: str = "copy") -> int:
         """
         Salva um DataFrame em uma tabela PostgreSQL de forma eficiente.
+
+        Por padrão utiliza o protocolo COPY (via bulk_insert_dataframe), que transmite
+        todas as linhas em um único fluxo sem parse de SQL por linha. O caminho com
+        INSERTs parametrizados fica disponível como fallback (method="insert").
         
         Args:
             df: DataFrame a ser salvo
             table_name: Nome da tabela de destino
-            batch_size: Tamanho do lote para inserções em massa
+            batch_size: Tamanho do lote para inserções em massa (apenas method="insert", padrão 2000)
             create_table: Se True, cria a tabela se não existir
             truncate: Se True, limpa a tabela antes da inserção
+            method: "copy" (padrão) ou "insert"
             
         Returns:
             int: Número de linhas inseridas
             
         Raises:
             psycopg2.Error: Em caso de erro no banco de dados
-            ValueError: Se o DataFrame estiver vazio
+            ValueError: Se o DataFrame estiver vazio ou o método for inválido
         """
 
         if df.empty:
             raise ValueError("❌ Não é possível salvar um DataFrame vazio.")
 
+        if method not in ("copy", "insert"):
+            raise ValueError(f"❌ Método de inserção inválido: {method}")
+
         if create_table:
             self.create_table_from_dataframe(df, table_name, if_not_exists=True)
 
         if truncate:
             self.truncate_table(table_name)
 
+        # ⚡ Caminho rápido: COPY FROM STDIN
+        if method == "copy":
+            if batch_size is not None:
+                self._logger.warning("⚠️ batch_size é ignorado no método COPY (fluxo único por DataFrame).")
+
+            self.bulk_insert_dataframe(df, table_name)
+            return len(df)
+
         data = self._prepare_data_for_insert(df)
-        columns = [f'"{col}"' for col in df.columns]
 
-        insert_query = sql.SQL("""
-            INSERT INTO {schema}.{table} ({columns})
-            VALUES ({placeholders})
-        """).format(
-            schema=sql.Identifier(self._config.schema),
-            table=sql.Identifier(table_name),
-            columns=sql.SQL(', ').join(map(sql.Identifier, df.columns)),
-            placeholders=sql.SQL(', ').join([sql.Placeholder()] * len(df.columns))
-        )
+        insert_query = _build_insert_sql(self._config.schema, table_name, tuple(df.columns))
 
         try:
-            with self._get_cursor() as cursor:
-                execute_batch(cursor, insert_query, data, page_size=batch_size)
+            with self._get_cursor(bulk_mode=True) as cursor:
+                # Um único INSERT multi-VALUES por página
+                execute_values(cursor, insert_query, data, page_size=batch_size or 2000)
                 rowcount = len(data)
                 self._logger.info(f"✅ {rowcount} linhas inseridas em {self._config.schema}.{table_name}")
 
@@ -362,6 +518,94 @@ class PostgreSQLHandler:
         except psycopg2.Error as e:
             self._logger.error(f"❌ Falha ao inserir dados em {table_name}: {e}")
 
+    def _copy_from_pipe(self, cursor: PgCursor, query: sql.Composed, write_csv: Callable[[BinaryIO], None]) -> None:
+        """
+        Executa o COPY lendo de um pipe alimentado por uma thread que serializa
+        os dados em CSV, sobrepondo a codificação e o envio pela rede e evitando
+        materializar o arquivo inteiro em memória.
+
+        Args:
+            cursor: Cursor da transação corrente
+            query: Query COPY ... FROM STDIN já composta
+            write_csv: Função que escreve o CSV (sem cabeçalho) no arquivo binário recebido
+        """
+
+        read_fd, write_fd = os.pipe()
+        errors: List[BaseException] = []
+
+        def _writer() -> None:
+            try:
+                with os.fdopen(write_fd, 'wb') as sink:
+                    write_csv(sink)
+            except BaseException as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=_writer, name="copy-writer", daemon=True)
+        writer.start()
+
+        try:
+            # Fechar a leitura em caso de erro libera a thread bloqueada no pipe
+            with os.fdopen(read_fd, 'rb') as source:
+                cursor.copy_expert(query, _CopySource(source, writer, errors))
+        finally:
+            writer.join()
+
+        if errors:
+            raise errors[0]
+
+    def _copy_dataframe(self, cursor: PgCursor, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Envia um DataFrame via COPY usando o cursor da transação corrente.
+
+        O CSV é transmitido por um pipe enquanto é escrito, gerado pelo writer C++
+        do Arrow quando disponível ou pelo to_csv do pandas caso contrário.
+
+        Args:
+            cursor: Cursor da transação corrente
+            df: DataFrame a ser enviado
+            table_name: Nome da tabela de destino
+        """
+
+        # 1. Construção da Query Segura
+        query = _build_copy_sql(self._config.schema, table_name, tuple(df.columns))
+
+        # 1.1 Mesma normalização de NULL do caminho com INSERT ('None' e '' viram NULL),
+        #     mantendo o dtype da coluna para a conversão ao Arrow
+        df = df.copy(deep=False)
+
+        for col in df.columns:
+            mask = _null_mask(df[col])
+
+            if mask.any():
+                df[col] = df[col].mask(mask)
+
+        # 2. Conversão para Arrow (colunas com tipos mistos caem no fallback do pandas)
+        arrow_table = None
+
+        if pa is not None:
+            try:
+                arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                self._logger.warning(f"⚠️ Conversão para Arrow falhou, usando CSV do pandas: {e}")
+
+        # 2.1 Datas no mesmo texto do caminho com INSERT (o writer do Arrow usaria segundos e nanossegundos)
+        if arrow_table is not None:
+            for i, field in enumerate(arrow_table.schema):
+                if pa.types.is_timestamp(field.type):
+                    arrow_table = arrow_table.set_column(
+                        i, field.name, pc.strftime(arrow_table.column(i), format=_DATETIME_TEXT_FORMAT)
+                    )
+
+        # 3. Streaming do writer (Arrow ou pandas) direto para o COPY
+        if arrow_table is not None:
+            self._copy_from_pipe(cursor, query, lambda sink: pa_csv.write_csv(arrow_table, sink, write_options=_ARROW_CSV_OPTIONS))
+        else:
+            self._copy_from_pipe(
+                cursor,
+                query,
+                lambda sink: df.to_csv(sink, index=False, header=False, sep='\t', date_format=_DATETIME_TEXT_FORMAT, encoding='utf-8')
+            )
+
     def bulk_insert_dataframe(self, df: pd.DataFrame, table_name: str) -> None:
         """
             Insere grandes volumes de dados usando o protocolo COPY do PostgreSQL.
@@ -374,33 +618,54 @@ class PostgreSQLHandler:
         if df.empty:
             self._logger.warning("❌ DataFrame vazio. Abortando bulk insert.")
             return
-        
-        # 1. Criam um buffer de texto em memória
-        buffer = io.StringIO()
-
-        # 2. Exporta o DF para o buffer como CSV (sem index e sem cabeçalho)
-        df.to_csv(buffer, index=False, header=False, sep='\t')
-        buffer.seek(0) # Volta para o início do "arquivo" em memória
 
         try:
-            with self._get_cursor() as cursor:
-              
-                # 3. Construção da Query Segura
-                query = sql.SQL("COPY {table} ({fields}) FROM STDIN WITH (FORMAT CSV, DELIMITER '\t', NULL '')").format(
-                    table=sql.Identifier(table_name),
-                    fields=sql.SQL(', ').join(map(sql.Identifier, df.columns))
-                )
+            with self._get_cursor(bulk_mode=True) as cursor:
 
                 self._logger.info(f"ℹ️  Iniciando COPY para a tabela {table_name}...")
 
-                # 4. Execução direta com o buffer
-                cursor.copy_expert(query, buffer)
+                self._copy_dataframe(cursor, df, table_name)
 
                 self._logger.info(f"✅ Bulk insert concluído: {len(df)} linhas em '{table_name}'")
         
         except Exception as e:
             self._logger.error(f"❌ Erro no bulk insert: {e}")
             raise
+
+    def bulk_insert_chunks(self, chunks: Iterable[pd.DataFrame], table_name: str) -> int:
+        """
+            Insere uma sequência de DataFrames via COPY em uma única transação,
+            consumindo cada bloco assim que é produzido (ex: leitura em streaming do Excel).
+            Args:
+                chunks: Iterável de DataFrames com as mesmas colunas
+                table_name: Nome da tabela de destino
+
+            Returns:
+                int: Total de linhas inseridas
+        """
+
+        total_rows = 0
+
+        try:
+            with self._get_cursor(bulk_mode=True) as cursor:
+
+                self._logger.info(f"ℹ️  Iniciando COPY em blocos para a tabela {table_name}...")
+
+                for chunk in chunks:
+                    if chunk.empty:
+                        continue
+
+                    self._copy_dataframe(cursor, chunk, table_name)
+                    total_rows += len(chunk)
+                    self._logger.debug(f"📦 Bloco enviado: {len(chunk)} linhas (total: {total_rows})")
+
+                self._logger.info(f"✅ Bulk insert concluído: {total_rows} linhas em '{table_name}'")
+
+            return total_rows
+        
+        except Exception as e:
+            self._logger.error(f"❌ Erro no bulk insert: {e}")
+            raise
     
     def truncate_table(self, table_name: str) -> None:
         """
@@ -442,7 +707,7 @@ class PostgreSQLHandler:
         """
 
         try:
-            with self._get_cursor() as cursor:
+            with self._get_cursor(cursor_factory=RealDictCursor) as cursor:
                 cursor.execute(query, params)
                 return cursor.fetchall()
 
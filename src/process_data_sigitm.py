@@ -1,11 +1,13 @@
+import os
 from pathlib import Path
 from platformdirs import user_downloads_dir
 import warnings
 import pandas as pd
-from datetime import datetime
-import pytz
-from typing import Optional
+from datetime import date, datetime
+from typing import Iterator, List, Optional
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from python_calamine import CalamineWorkbook
 from .syslog import SystemLogger
 
 @dataclass
@@ -64,7 +66,17 @@ class ExcelFileHandler:
     PREFIX = "CONSULTA_LOTE4_FECHADAS"
 
     DATE_COLUMNS = ("data_criacao", "data_encerramento")
-    DISPLAY_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+    ID_COLUMNS = ("sequencia", "vta_pk", "raiz")
+
+    # Formatos de data/hora exportados pelo SIGITM (testados em ordem)
+    SOURCE_DATETIME_FORMATS = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y")
+
+    # Quantidade de linhas por bloco na leitura em streaming
+    CHUNK_SIZE = 50_000
+
+    # Representações textuais de nulo que devem virar NA
+    NULL_MARKERS = ("", "None", "nan", "NaT")
 
     def __init__(self, directory: Optional[Path] = None, prefix: str = PREFIX):
         """Inicializa o handler com diretório e prefixo.
@@ -95,15 +107,89 @@ class ExcelFileHandler:
             FileNotFoundError: Se nenhum arquivo for encontrado
         """
 
-        search_pattern = f"{self.prefix}*"
-        files = list(self.directory.glob(search_pattern))
+        # scandir evita o fnmatch do glob e reaproveita o stat de cada DirEntry
+        with os.scandir(self.directory) as entries:
+            files = [entry for entry in entries if entry.name.startswith(self.prefix)]
 
-        if not files:
-            self.logger.error(f"❌ Nenhum arquivo encontrado com o prefixo: {self.prefix}")
-            raise FileNotFoundError(f"❌ Nenhum arquivo com prefixo {self.prefix} encontrado em {self.directory}")
-        
-        return max(files, key=lambda f: f.stat().st_mtime)
+            if not files:
+                self.logger.error(f"❌ Nenhum arquivo encontrado com o prefixo: {self.prefix}")
+                raise FileNotFoundError(f"❌ Nenhum arquivo com prefixo {self.prefix} encontrado em {self.directory}")
+            
+            return Path(max(files, key=lambda entry: entry.stat().st_mtime).path)
     
+    def _detect_datetime_format(self, series: pd.Series) -> Optional[str]:
+        """Identifica o formato de data da coluna a partir do primeiro valor não nulo.
+        
+        Args:
+            series: Coluna com datas em texto
+            
+        Returns:
+            Formato compatível ou None se nenhum dos formatos conhecidos se aplicar
+        """
+
+        sample = series.dropna()
+
+        if sample.empty:
+            return None
+
+        first_value = str(sample.iloc[0]).strip()
+
+        for fmt in self.SOURCE_DATETIME_FORMATS:
+            try:
+                datetime.strptime(first_value, fmt)
+                return fmt
+            except ValueError:
+                continue
+
+        return None
+
+    def _parse_datetime_column(self, values: pd.Series) -> pd.Series:
+        """Converte uma coluna de datas para datetime64, aceitando texto e células de data nativas.
+
+        O calamine devolve células formatadas como data no Excel como objetos datetime;
+        elas são convertidas diretamente e apenas os valores em texto passam pela detecção de formato.
+        
+        Args:
+            values: Coluna original
+            
+        Returns:
+            Coluna convertida (valores inválidos viram NaT)
+        """
+
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+
+        native = pd.Series([isinstance(value, date) for value in values], index=values.index, dtype=bool)
+        text = values.where(~native)
+
+        # Formato explícito usa o parser em C; sem formato conhecido, cai na inferência
+        date_format = self._detect_datetime_format(text)
+
+        if date_format:
+            parsed = pd.to_datetime(text, format=date_format, errors='coerce', cache=True)
+        else:
+            parsed = pd.to_datetime(text, dayfirst=True, errors='coerce')
+
+        if native.any():
+            parsed = parsed.where(~native, pd.to_datetime(values.where(native), errors='coerce'))
+
+        return parsed
+
+    def _normalize_text_column(self, values: pd.Series) -> pd.Series:
+        """Converte uma coluna de texto para string[pyarrow] marcando os nulos textuais como NA.
+        
+        Args:
+            values: Coluna original
+            
+        Returns:
+            Coluna normalizada
+        """
+
+        values = values.astype("string[pyarrow]", copy=False)
+        null_mask = values.isin(self.NULL_MARKERS)
+
+        return values.mask(null_mask) if null_mask.any() else values
+
     def _process_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Processa o dataframe com transformações necessárias.
         
@@ -117,19 +203,16 @@ class ExcelFileHandler:
         # Renomeia colunas
         df = df.rename(columns=self.COLUMN_MAPPING)
 
-        # Defini fuso horário do Brasil(BRT - Brasília, UTC-3)
-        fuso_horario = pytz.timezone("America/Sao_Paulo")
-
-        # Pegando a data atual, e concatenando com a hora 00:00
-        dthr_corte = datetime.now(fuso_horario).replace(hour=0, minute=0, second=0, microsecond=0).replace(tzinfo=None)
+        # Pegando a data atual no fuso do Brasil (BRT - Brasília, UTC-3) com a hora 00:00, sem fuso
+        dthr_corte = pd.Timestamp.now(tz="America/Sao_Paulo").normalize().tz_localize(None)
 
         for col in self.DATE_COLUMNS:
             if col in df.columns:
                 try:
                     with warnings.catch_warnings():
                         warnings.simplefilter('ignore', UserWarning)
-                        # 1. Converte a string original para objeto datetime do Pandas
-                        df[col] = pd.to_datetime(df[col], dayfirst=True, errors='coerce')
+                        # 1. Converte a string original (ou a data nativa do Excel) para objeto datetime do Pandas
+                        df[col] = self._parse_datetime_column(df[col])
 
                         # 2. Remove fuso horário da coluna caso o Pandas tenha inserido
                         if df[col].dt.tz is not None:
@@ -140,24 +223,22 @@ class ExcelFileHandler:
 
         df = df[df['data_encerramento'] < dthr_corte].copy()
 
-        # Formatação final para string
-        for col in self.DATE_COLUMNS:
-            if col in df.columns:
-                df[col] = df[col].dt.strftime(self.DISPLAY_DATETIME_FORMAT).where(df[col].notnull(), None)               
-
         # Tratamento de IDs e tipagem Segura                        
-        id_cols = ["sequencia", "vta_pk", "raiz"]
-
-        for col in id_cols:
+        for col in self.ID_COLUMNS:
             if col in df.columns:
-                df[col] = df[col].fillna(0).astype('Int64').astype(str).replace('0', None)
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
         
-        # Limpeza Final (Substitui 'NaT' gerado pelo strftime por None)
-        df = df.replace({pd.NA: None, "nan": None, "None": None, "": None, "NaT": None})
-        
-        # Normalização de colunas de texto
-        text_cols = df.select_dtypes(include=['object']).columns
-        df[text_cols] = df[text_cols].astype(str).replace("None", None)
+        # Limpeza Final e normalização de colunas de texto:
+        # converte para string[pyarrow] e marca os nulos textuais ('None', 'nan', ...) como NA
+        text_cols = [col for col, dtype in df.dtypes.items() if pd.api.types.is_string_dtype(dtype)]
+
+        # Colunas independentes: normalizadas em paralelo (os kernels Arrow liberam o GIL)
+        if text_cols:
+            with ThreadPoolExecutor(max_workers=min(len(text_cols), os.cpu_count() or 1)) as executor:
+                normalized = list(executor.map(self._normalize_text_column, (df[col] for col in text_cols)))
+
+            for col, values in zip(text_cols, normalized):
+                df[col] = values
 
         # Deleta coluna VTA PK
         df.drop('vta_pk', axis=1, inplace=True)                
@@ -168,7 +249,15 @@ class ExcelFileHandler:
         """Carrega arquivos Excel """
         try:
 
-            df = pd.read_excel(file_path, engine='calamine')
+            # Mesma leitura célula a célula do caminho em blocos: datas nativas do Excel
+            # continuam datetime (o read_excel as converteria para texto ISO em colunas mistas)
+            rows_iter = CalamineWorkbook.from_path(str(file_path)).get_sheet_by_index(0).iter_rows()
+
+            header = next(rows_iter, None)
+            if header is None:
+                return FileProcessingResult(success=False, message="Planilha vazia")
+
+            df = self._build_chunk([str(col) for col in header], list(rows_iter))
 
             processed_df = self._process_dataframe(df)
 
@@ -179,6 +268,95 @@ class ExcelFileHandler:
         except Exception as e:
             return FileProcessingResult(success=False, message=f"Erro ao processar arquivo: {str(e)}") 
 
+    @staticmethod
+    def _cell_to_text(value: object) -> Optional[str]:
+        """Converte uma célula do calamine para texto (números inteiros sem o '.0' do float)."""
+
+        # Células vazias chegam como "" do calamine; o read_excel as trata como nulas
+        if value is None or value == "":
+            return None
+
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+
+        return str(value)
+
+    def _build_chunk(self, header: List[str], rows: List[list]) -> pd.DataFrame:
+        """Monta um bloco de linhas cruas do calamine com o mesmo esquema em todos os blocos.
+
+        Os tipos não são inferidos pelo conteúdo do bloco (um bloco só com nulos ou só com
+        números teria outro dtype): datas e IDs seguem crus para o _process_dataframe e as
+        demais colunas são sempre string[pyarrow].
+        
+        Args:
+            header: Nomes das colunas (primeira linha da planilha)
+            rows: Linhas do bloco
+            
+        Returns:
+            DataFrame do bloco
+        """
+
+        columns = {}
+
+        # Sem linhas o zip(*rows) não produz colunas; mantém o cabeçalho com colunas vazias
+        column_values = zip(*rows) if rows else ([] for _ in header)
+
+        for name, values in zip(header, column_values):
+            target = self.COLUMN_MAPPING.get(name, name)
+
+            if target in self.DATE_COLUMNS or target in self.ID_COLUMNS:
+                columns[name] = pd.Series([None if value == "" else value for value in values], dtype=object)
+            else:
+                columns[name] = pd.Series([self._cell_to_text(value) for value in values], dtype="string[pyarrow]")
+
+        return pd.DataFrame(columns)
+
+    def iter_processed_chunks(self, file_path: Optional[Path] = None, chunk_size: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Lê o Excel em blocos via calamine e produz cada bloco já processado.
+
+        O pico de memória fica limitado ao tamanho do bloco, permitindo que a carga
+        no banco consuma um bloco enquanto o próximo é lido.
+        
+        Args:
+            file_path: Arquivo a ser lido. Padrão: arquivo mais recente com o prefixo
+            chunk_size: Quantidade de linhas por bloco
+            
+        Yields:
+            DataFrame processado de cada bloco (blocos vazios após o filtro são ignorados)
+        """
+
+        target_path = file_path if file_path else self._find_most_recent_file()
+        self.logger.info(f"🎯 Alvo de processamento: {target_path.name}")
+
+        sheet = CalamineWorkbook.from_path(str(target_path)).get_sheet_by_index(0)
+        rows_iter = sheet.iter_rows()
+
+        header = next(rows_iter, None)
+        if header is None:
+            self.logger.warning("⚠️ Planilha vazia")
+            return
+
+        header = [str(col) for col in header]
+        rows: List[list] = []
+
+        for row in rows_iter:
+            rows.append(row)
+
+            if len(rows) >= chunk_size:
+                chunk = self._process_dataframe(self._build_chunk(header, rows))
+                rows = []
+
+                if not chunk.empty:
+                    yield chunk
+
+        if rows:
+            chunk = self._process_dataframe(self._build_chunk(header, rows))
+
+            if not chunk.empty:
+                yield chunk
+
+        self.logger.info("✅ Arquivo Excel processado com sucesso.")
+
     def process_most_recent_file(self, file_path: Path) -> FileProcessingResult:
         """Processa o arquivo mais recente encontrado.
         
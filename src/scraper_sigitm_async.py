@@ -1,14 +1,38 @@
 import asyncio
+import base64
+import contextlib
+import os
+import shutil
 import time
+import zipfile
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
-from playwright.async_api import async_playwright, Page, Playwright, Locator, BrowserContext
+from playwright.async_api import async_playwright, Page, Playwright, Locator, BrowserContext, CDPSession, TimeoutError as PlaywrightTimeoutError, Error as PlaywrightError
 from platformdirs import user_downloads_dir
 from pathlib import Path
 from twocaptcha import TwoCaptcha
 from .syslog import SystemLogger
 from .psw import username, password, chave_api
 
+# Assinaturas de arquivo: ZIP (.xlsx) e OLE2 (.xls)
+_ZIP_MAGIC = b'PK\x03\x04'
+_XLS_MAGIC = bytes.fromhex('D0CF11E0A1B11AE1')
+
+# Predicado avaliado no browser: total de registros do indicador de paginação visível (ou false)
+_CONSULTA_TOTAL_JS = """() => {
+    const indicators = document.querySelectorAll('div.my-paging-display.x-component');
+
+    for (const el of indicators) {
+        const text = el.textContent || '';
+        if (el.offsetParent === null || !text.toLowerCase().includes('a visualizar')) continue;
+
+        const match = text.match(/de\\s+(\\d+)/);
+        if (match && parseInt(match[1], 10) > 0) return parseInt(match[1], 10);
+    }
+
+    return false;
+}"""
+
 class SIGITMAutomation:
     """
     Classe principal para automação do acesso ao sistema SIGITM da Vivo.
@@ -40,13 +64,30 @@ class SIGITMAutomation:
         self.username = username
         self.password = password
         self.api_key_2captcha = chave_api
+        # Cliente único do 2captcha, consultando o resultado a cada 2 s (padrão do SDK: 10 s)
+        self.solver = TwoCaptcha(self.api_key_2captcha, pollingInterval=2)
         self.logger = SystemLogger.configure_logger('SIGITMAutomation')
         self.playwright_engine: Playwright = None
         self.context: BrowserContext = None
         self.page: Page = None
+        self.cdp: CDPSession = None
+        self.cdp_page: Page = None
         self.download_dir = Path(user_downloads_dir())
+        # Perfil persistente fora do CWD (em Docker, montar um volume e apontar SIGITM_PROFILE_DIR)
+        self.profile_dir = Path(os.environ.get("SIGITM_PROFILE_DIR") or self.download_dir.parent / ".sigitm_profile")
         self.max_captcha_retries = 5
 
+    @staticmethod
+    def _shm_is_large_enough(min_bytes: int = 512 * 1024 ** 2) -> bool:
+        """
+        Verifica se /dev/shm tem tamanho suficiente para o Chromium usar memória compartilhada.
+        Em Docker, execute com --shm-size=1g para habilitar esse caminho.
+        """
+        try:
+            return shutil.disk_usage('/dev/shm').total >= min_bytes
+        except OSError:
+            return False
+
     async def _setup_browser(self) -> Page:
         """
         Configuração do browser
@@ -55,12 +96,14 @@ class SIGITMAutomation:
             Page: Página configurada e pronta
         """
 
-        # 🚀 Inicialização direta
-        self.playwright_engine = await async_playwright().start()
+        profile_path = self.profile_dir
 
-        # Cria diretório para perfil persistente
-        profile_path = Path("chrome_profile_normal")
-        profile_path.mkdir(exist_ok=True)
+        # 🚀 Sobe o driver do Playwright enquanto cria o diretório do perfil persistente
+        # (cookies/sessão sobrevivem entre execuções)
+        self.playwright_engine, _ = await asyncio.gather(
+            async_playwright().start(),
+            asyncio.to_thread(profile_path.mkdir, parents=True, exist_ok=True)
+        )
 
         # ✅ CONTEXTO PERSISTENTE - todas as páginas herdam este perfil
         self.context = await self.playwright_engine.chromium.launch_persistent_context(
@@ -70,12 +113,26 @@ class SIGITMAutomation:
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             accept_downloads=True,
             ignore_https_errors=True,
+            chromium_sandbox=False,
+            env={**os.environ, 'HOME': str(profile_path.resolve())}, # Mantém arquivos de configuração dentro do perfil
             args=[
                 '--disable-blink-features=AutomationControlled',
                 '--no-sandbox',           # Necessário em ambientes Linux/CI
                 '--disable-gpu',          # Reduz o uso de recursos gráficos
-                '--disable-dev-shm-usage',# Essencial para execução em Docker/CI
-                '--no-default-browser-check' # Otimização de tempo de inicialização
+                '--no-default-browser-check', # Otimização de tempo de inicialização
+                # Tarefas de fundo do Chromium (memória/CPU e requisições que não pertencem à página)
+                '--disable-extensions',
+                '--disable-background-networking',
+                '--disable-background-timer-throttling',
+                '--disable-sync',
+                '--disable-translate',
+                '--disable-features=TranslateUI,MediaRouter,OptimizationHints',
+                '--mute-audio',
+                '--disable-component-update',
+                '--disable-domain-reliability',
+                '--disable-client-side-phishing-detection',
+                # /dev/shm pequeno (padrão de 64 MB no Docker) derruba abas: só nesse caso usa /tmp
+                *([] if self._shm_is_large_enough() else ['--disable-dev-shm-usage'])
                 ]
         )
 
@@ -98,19 +155,76 @@ class SIGITMAutomation:
     async def _load_page_coroutines(self, check_elements: list = None):
         """Corotinas para verificação de carregamento"""
 
-        tasks = [
-           self.page.wait_for_load_state('networkidle'), # 1️⃣ Rede ociosa
-           self.page.wait_for_function("document.readyState === 'complete'") # 2️⃣ DOM completo
-        ]
-
-        # 3️⃣ Elementos específicos (opcional)
+        # 1️⃣ Elementos específicos definem a prontidão da página (sem aguardar 'networkidle')
         if check_elements:
-            for selector in check_elements:
-                tasks.append(self.page.wait_for_selector(selector, state='visible', timeout=15000))
+            tasks = [self.page.wait_for_selector(selector, state='visible', timeout=15000) for selector in check_elements]
+        
+        # 2️⃣ Sem seletores, aguarda apenas o DOM completo
+        else:
+            tasks = [self.page.wait_for_function("document.readyState === 'complete'")]
 
-        # 🔄 Executa tudo em paralelo
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-        return all(not isinstance(result, Exception) for result in results)       
+        # 🔄 Executa tudo em paralelo; a primeira falha cancela as demais (semântica do TaskGroup)
+        pending = [asyncio.ensure_future(task) for task in tasks]
+
+        try:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+
+        errors = [task.exception() for task in done if task.exception() is not None]
+        if errors:
+            raise errors[0]
+
+        return True
+
+    async def _wait_for_quiet_network(self, quiet_ms: int = 1500, timeout: int = 30000) -> bool:
+        """
+        Aguarda a rede ficar ociosa: nenhuma requisição pendente por `quiet_ms`.
+        Usado apenas onde a quiescência é realmente necessária (ex: após 'Executar').
+        
+        Args:
+            quiet_ms: Janela sem requisições pendentes, em milissegundos
+            timeout: Tempo máximo de espera, em milissegundos
+            
+        Returns:
+            bool: True se a rede ficou ociosa dentro do timeout
+        """
+
+        pending = set()
+        last_activity = time.monotonic()
+
+        def on_request(request):
+            nonlocal last_activity
+            pending.add(request)
+            last_activity = time.monotonic()
+
+        def on_request_done(request):
+            nonlocal last_activity
+            pending.discard(request)
+            last_activity = time.monotonic()
+
+        self.page.on("request", on_request)
+        self.page.on("requestfinished", on_request_done)
+        self.page.on("requestfailed", on_request_done)
+
+        try:
+            deadline = time.monotonic() + timeout / 1000
+
+            while time.monotonic() < deadline:
+                if not pending and (time.monotonic() - last_activity) * 1000 >= quiet_ms:
+                    return True
+                
+                await asyncio.sleep(0.1)
+
+            self.logger.warning(f"⌛ Timeout {timeout}ms aguardando rede ociosa ({len(pending)} requisições pendentes)")
+            return False
+        
+        finally:
+            self.page.remove_listener("request", on_request)
+            self.page.remove_listener("requestfinished", on_request_done)
+            self.page.remove_listener("requestfailed", on_request_done)
 
     async def _wait_for_page(self, step_name: str, timeout: int = 60, check_elements: list = None) -> bool:
         """
@@ -122,7 +236,7 @@ class SIGITMAutomation:
             check_elements: Lista de seletores para verificar (opcional)
         """        
 
-        self.logger.info(f"⌛ Aguardando carregamento: {step_name}")
+        self.logger.info("⌛ Aguardando carregamento: %s", step_name)
         start_time = time.time()
 
         try:
@@ -132,21 +246,21 @@ class SIGITMAutomation:
             load_time = time.time() - start_time
 
             if success:
-                self.logger.info(f"✅ {step_name} carregado em {load_time:.1f}s")
+                self.logger.info("✅ %s carregado em %.1fs", step_name, load_time)
                 return True
             else:
-                self.logger.error(f"❌ {step_name} - Alguns elementos não foram carregados")
+                self.logger.error("❌ %s - Alguns elementos não foram carregados", step_name)
                 return False
         
         except asyncio.TimeoutError:
-            self.logger.error(f"⌛ Timeout {timeout}s em: {step_name}")
+            self.logger.error("⌛ Timeout %ss em: %s", timeout, step_name)
             
             # Verifica se algum elemento crítico está presente mesmo com timeout
             if check_elements:
                 for selector in check_elements:
                     try:
                         if await self.page.locator(selector).count() > 0:
-                            self.logger.info(f"✅ Elemento {selector} encontrado mesmo com timeout")
+                            self.logger.info("✅ Elemento %s encontrado mesmo com timeout", selector)
                                 
                             return True
                     except:
@@ -189,6 +303,42 @@ class SIGITMAutomation:
             self.logger.error(f"❌ Falha ao localizar elementos: {e}")
             raise
     
+    async def _capture_element_base64(self, element: Locator) -> str:
+        """
+        Captura o PNG de um elemento direto via CDP (Page.captureScreenshot com clip),
+        evitando os passos extras do screenshot do Playwright
+        
+        Args:
+            element (Locator): Locator do elemento
+            
+        Returns:
+            str: PNG do elemento codificado em base64
+        """
+        # 📸 Sessão CDP aberta sob demanda para a página dona do elemento (a página ativa muda após o login)
+        if self.cdp is None or self.cdp_page is not element.page:
+            self.cdp = await self.context.new_cdp_session(element.page)
+            self.cdp_page = element.page
+
+        # Rola o elemento para a viewport e lê o retângulo em coordenadas do documento (usadas pelo clip do CDP)
+        box = await element.evaluate(
+            """el => {
+                el.scrollIntoView({block: 'nearest'});
+                const r = el.getBoundingClientRect();
+                return {x: r.x + scrollX, y: r.y + scrollY, width: r.width, height: r.height};
+            }"""
+        )
+
+        if not box["width"] or not box["height"]:
+            return base64.b64encode(await element.screenshot()).decode()
+
+        result = await self.cdp.send("Page.captureScreenshot", {
+            "format": "png",
+            "clip": {**box, "scale": 1}
+        })
+
+        # O CDP já devolve o PNG em base64, formato aceito pelo 2captcha
+        return result["data"]
+
     async def _solve_captcha(self, captcha_image: Locator) -> Optional[str]:
         """
         Resolve captcha
@@ -203,42 +353,26 @@ class SIGITMAutomation:
         self.logger.info("🔐 Resolvendo captcha...")
 
         try:
-            # ✅ SALVAR EM ARQUIVO TEMPORÁRIO
-            import tempfile
-            import os
-
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-                temp_path = tmp_file.name
-            
-            # Salvar screenshot no arquivo temporário
-            await captcha_image.screenshot(path=temp_path)
+            # ✅ Screenshot em memória (sem arquivo temporário), já em base64
+            captcha_base64 = await self._capture_element_base64(captcha_image)
 
-            # ✅ SOLUÇÃO COM CAMINHO DO ARQUIVO
-            solver = TwoCaptcha(self.api_key_2captcha)
-            result = solver.normal(temp_path)
-
-            # ✅ LIMPEZA AUTOMÁTICA - liberação imediata de memória
-            try:
-                os.unlink(temp_path)
-                self.logger.debug("✅ Arquivo temporário removido")
-            
-            except:
-                pass            
+            # ✅ SOLUÇÃO EM THREAD - não bloqueia o event loop durante o polling do 2captcha
+            result = await asyncio.to_thread(self.solver.normal, captcha_base64)
 
             if (solution := result.get('code')):
                 self.logger.info(f"✅ Captcha resolvido: {solution}")
                 return solution
 
         except Exception as e:
-            self.logger.warning(f"❌ Erro inesperado ao processar CAPTCHA:: {str(e)[:100]}...")
+            self.logger.warning("❌ Erro inesperado ao processar CAPTCHA:: %.100s...", e)
             return None
     
-    async def _fill_login_form(self) -> bool:
+    async def _fill_login_form(self, elements: Optional[Tuple[Locator, ...]] = None) -> bool:
         """
         Preenche o formulário.
         
         Args:
-            initial_captcha_src: Source inicial do captcha para comparação
+            elements: Elementos já localizados por _locate_login_elements (localiza se None)
             
         Returns:
             bool: True se bem-sucedido
@@ -246,8 +380,9 @@ class SIGITMAutomation:
 
         self.logger.info("🖊️ Preenchendo formulário...")
 
-        # Buscar elementos
-        elements = await self._locate_login_elements()
+        # Buscar elementos (apenas se não foram repassados)
+        if elements is None:
+            elements = await self._locate_login_elements()
         username, password, captcha_image, captcha_field = elements
 
         if None in [username, password, captcha_image, captcha_field]:
@@ -294,40 +429,61 @@ class SIGITMAutomation:
             self.logger.error("❌ Contexto do browser não inicializado")
             return None
         
-        start_time = time.time()
         old_page = self.page
 
-        # Verificação de páginas existentes
-        while (time.time() - start_time) * 1000 < timeout:
-            try:
-                pages = self.context.pages
+        try:
+            # A janela pode já ter sido aberta antes desta chamada
+            new_page = next((page for page in self.context.pages if page != old_page and not page.is_closed()), None)
 
-                if len(pages) > 1:
-                    for page in pages:
-                        if page != self.page and not page.is_closed():
-                            self.logger.info("✅ Nova janela encontrada")
+            # ⚡ Caso contrário, aguarda o evento 'page' do contexto (sem polling)
+            if new_page is None:
+                new_page = await self.context.wait_for_event("page", timeout=timeout)
 
-                            # ✅ FECHA a página anterior
-                            if not old_page.is_closed():
-                                await old_page.close()
-                                self.logger.info("🔚 Página anterior fechada")
-                            
-                            # ✅ Atualiza para a nova página
-                            self.page = page
-                            await self.page.bring_to_front()
-
-                            return page
-                
-                # Pequena pausa entre verificações
-                await asyncio.sleep(0.5)
+            self.logger.info("✅ Nova janela encontrada")
+            await new_page.wait_for_load_state("domcontentloaded")
 
-            except Exception as e:
-                self.logger.warning(f"❌ Erro ao verificar páginas: {e}")
-                break
+            # ✅ FECHA a página anterior
+            if not old_page.is_closed():
+                await old_page.close()
+                self.logger.info("🔚 Página anterior fechada")
             
-        self.logger.warning(f"⌛ Timeout {timeout}ms - Nova janela não detectada")
-        return None
+            # ✅ Atualiza para a nova página
+            self.page = new_page
+            await self.page.bring_to_front()
+
+            return new_page
+
+        except PlaywrightTimeoutError:
+            self.logger.warning(f"⌛ Timeout {timeout}ms - Nova janela não detectada")
+            return None
+
+        except Exception as e:
+            self.logger.warning(f"❌ Erro ao verificar páginas: {e}")
+            return None
     
+    async def _captcha_changed(self, initial_captcha_src: str, timeout: int = 30000) -> bool:
+        """
+        Aguarda a troca do src do captcha, indicando que a solução enviada foi recusada
+        
+        Args:
+            initial_captcha_src: Source do captcha antes do envio do formulário
+            timeout: Timeout em milissegundos
+            
+        Returns:
+            bool: True se o captcha foi trocado dentro do timeout
+        """
+        try:
+            await self.page.wait_for_function(
+                "(src) => { const img = document.getElementById('captcha'); return !!img && img.getAttribute('src') !== src; }",
+                arg=initial_captcha_src,
+                timeout=timeout
+            )
+            return True
+        
+        except PlaywrightError:
+            # Timeout ou página fechada após o login: captcha não mudou
+            return False
+
     async def _verify_login_sucess(self, initial_captcha_src) -> bool:
         """
         Verifica sucesso do login de forma robusta com verificação de captcha
@@ -340,24 +496,22 @@ class SIGITMAutomation:
         """         
         self.logger.info("🔍 Verificando sucesso do login...")
 
-        # 🔍 1. PRIMEIRO: Verifica se o captcha mudou (indicando tentativa falha)
-        if initial_captcha_src:         
-            try:
-                captcha_locator = self.page.locator('//*[@id="captcha"]')
+        # ⚡ Nova janela (sucesso) e troca do captcha (falha) são aguardadas em paralelo:
+        # o primeiro sinal decide, sem esperar timeout do outro
+        window_task = asyncio.create_task(self._wait_for_new_window())
 
-                if await captcha_locator.is_visible(timeout=5000):
-                    current_src = await captcha_locator.get_attribute("src")
+        if initial_captcha_src:
+            captcha_task = asyncio.create_task(self._captcha_changed(initial_captcha_src))
+            done, _ = await asyncio.wait({captcha_task, window_task}, return_when=asyncio.FIRST_COMPLETED)
 
-                    if current_src != initial_captcha_src:
-                        self.logger.warning("🔄 Captcha mudou - solução anterior estava incorreta")
-                        return False
-            
-            except:
-                #  Se não encontrou o captcha, provavelmente o login foi bem-sucedido
-                pass
+            if captcha_task in done and captcha_task.result():
+                window_task.cancel()
+                self.logger.warning("🔄 Captcha mudou - solução anterior estava incorreta")
+                return False
 
-         # 🔍 2. SEGUNDO: Aguarda nova janela (indicador de sucesso)
-        new_page = await self._wait_for_new_window()
+            captcha_task.cancel()
+
+        new_page = await window_task
         
         if new_page:
             try:
@@ -379,8 +533,16 @@ class SIGITMAutomation:
         try:
             # Configuração inicial
             page = await self._setup_browser()
-            await page.goto(self.login_url)
-            await self._wait_for_page(step_name="Página de Login")
+            await page.goto(self.login_url, wait_until="domcontentloaded", timeout=60000)
+
+            # ⏳ Pronto quando aparece o formulário de login ou a tela de boas-vindas
+            welcome_locator = self.page.locator("text=Bem-vindo")
+            await self.page.locator("#username").or_(welcome_locator).first.wait_for(state="visible", timeout=60000)
+
+            # Sessão persistida no perfil ainda válida: dispensa formulário e captcha
+            if await welcome_locator.count() > 0:
+                self.logger.info("✅ Sessão anterior ainda válida - login dispensado")
+                return True
 
             # Tentativas de login
             for attempt in range(1, self.max_captcha_retries + 1):
@@ -393,7 +555,7 @@ class SIGITMAutomation:
                     initial_captcha_src = await captcha_image.get_attribute("src")
 
                     # Preenche o formulário
-                    if await self._fill_login_form():
+                    if await self._fill_login_form(elements):
                         # Aguarda um breve momento para processamento
                         await asyncio.sleep(1)
 
@@ -417,6 +579,25 @@ class SIGITMAutomation:
             self.logger.error(f"❌ Erro crítico durante o login: {e}")
             return False
     
+    @staticmethod
+    async def _wait_visible(locator: Locator, timeout: int = 15000) -> bool:
+        """
+        Aguarda o elemento ficar visível (is_visible não espera: ignora o timeout)
+        
+        Args:
+            locator: Locator do elemento
+            timeout: Timeout em milissegundos
+            
+        Returns:
+            bool: True se o elemento ficou visível dentro do timeout
+        """
+        try:
+            await locator.wait_for(state="visible", timeout=timeout)
+            return True
+        
+        except PlaywrightTimeoutError:
+            return False
+
     async def _settings_consulta(self) -> bool:
         """
         Clica no menu 'Consultas' após o login bem-sucedido.
@@ -430,9 +611,9 @@ class SIGITMAutomation:
         try:
 
             # 🔍 PASSO 1: Clicar no menu principal "Consulta"
-            lista_consulta_locator = self.page.locator("span.x-panel-header-text", has_text="Consulta")
+            lista_consulta_locator = self.page.locator("span.x-panel-header-text", has_text="Consulta").first
 
-            if not await lista_consulta_locator.is_visible(timeout=15000):
+            if not await self._wait_visible(lista_consulta_locator):
                 self.logger.error("❌ Menu 'Consulta' não está visível")
                 return False
             
@@ -440,9 +621,9 @@ class SIGITMAutomation:
             self.logger.info("✅ Menu 'Consulta' clicado.")
 
             # 🔍 PASSO 2: Clicar no item "Consultas"
-            consultas_locator = self.page.locator("span.x-tree3-node-text", has_text="Consultas")
+            consultas_locator = self.page.locator("span.x-tree3-node-text", has_text="Consultas").first
 
-            if not await consultas_locator.is_visible(timeout=15000):
+            if not await self._wait_visible(consultas_locator):
                 self.logger.error("❌ Item 'Consultas' não está visível")
                 return False
             
@@ -457,9 +638,9 @@ class SIGITMAutomation:
                 return False
             
             # 🔍 PASSO 4: Clicar na consulta específica
-            consulta_locator = self.page.locator(element_xpath)
+            consulta_locator = self.page.locator(element_xpath).first
 
-            if not await consultas_locator.is_visible(timeout=15000):
+            if not await self._wait_visible(consulta_locator):
                 self.logger.error(f"❌ Consulta '{self.CONSULTA_NAME}' não encontrada")
                 return False
 
@@ -480,12 +661,19 @@ class SIGITMAutomation:
         btn_salvar_locator = self.page.locator("button.x-btn-text", has_text="Salvar")
         bnt_executar_locator = self.page.locator("button.x-btn-text", has_text="Executar")
 
-        try:
-            # 🔍 Localiza o campo específico de Data de Baixa
-            field_data_encerramento_locator = self.page.locator("xpath=//tr[.//span[text()='Data Encerramento']]//td[2]//b")
+        # 🔍 Localiza o campo específico de Data de Baixa
+        field_data_encerramento_locator = self.page.locator("xpath=//tr[.//span[text()='Data Encerramento']]//td[2]//b")
 
-            if not await field_data_encerramento_locator.is_visible(timeout=15000):
-                self.logger.error("❌ Campo 'Data Encerramento' não encontrado")
+        try:
+            # ⏳ Aguarda os três elementos em paralelo (são independentes entre si)
+            try:
+                await asyncio.gather(
+                    btn_salvar_locator.wait_for(state="visible", timeout=15000),
+                    bnt_executar_locator.wait_for(state="visible", timeout=15000),
+                    field_data_encerramento_locator.wait_for(state="visible", timeout=15000),
+                )
+            except PlaywrightTimeoutError:
+                self.logger.error("❌ Campo 'Data Encerramento' ou botões Salvar/Executar não encontrados")
                 return False
             
             # 📅 Obtém o valor atual antes da modificação
@@ -499,9 +687,12 @@ class SIGITMAutomation:
             await asyncio.sleep(0.5)
 
            # 🔍 Busca o campo de input ESPECÍFICO para data usando contexto mais preciso 
-            input_field_data = self.page.locator("input:focus")
+            # ExtJS marca o editor ativo com 'x-form-focus'; ':focus' fica como reserva
+            input_field_data = self.page.locator("input.x-form-focus, input:focus").first
 
-            if not await input_field_data.is_visible(timeout=2000):
+            try:
+                await input_field_data.wait_for(state="visible", timeout=2000)
+            except PlaywrightTimeoutError:
                 self.logger.error("❌ Nenhum input adequado encontrado")   
                 return False         
 
@@ -514,8 +705,12 @@ class SIGITMAutomation:
             self.logger.info(f"🔄 Alterando data: {data_ant} → {new_date}")
 
             await input_field_data.click(force=True)
-            await input_field_data.fill("")
-            await input_field_data.fill(new_date)
+            # fill() já limpa o campo antes de preencher
+            try:
+                await input_field_data.fill(new_date)
+            except PlaywrightError:
+                # Campo recusou o preenchimento programático: digita em uma única chamada
+                await input_field_data.press_sequentially(new_date, delay=0)
             await self.page.keyboard.press("Enter")
 
             data_pos = await field_data_encerramento_locator.text_content()
@@ -531,6 +726,7 @@ class SIGITMAutomation:
                 await bnt_executar_locator.click()
                 self.logger.info("⚙️ Executando consulta...")
 
+                await self._wait_for_quiet_network()
                 await self._wait_for_page(step_name="Página de resultado da consulta", check_elements=["button.x-btn-text:has-text('Exportar')"])
                 return True
 
@@ -551,7 +747,7 @@ class SIGITMAutomation:
 
                 # 1. Localiza o botão Exportar
                 btn_exportar = self.page.locator("button.x-btn-text", has_text="Exportar")
-                if not await btn_exportar.is_visible(timeout=10000):
+                if not await self._wait_visible(btn_exportar, timeout=10000):
                     self.logger.error("❌ Botão 'Exportar' não encontrado")
                     return None
                 
@@ -571,17 +767,23 @@ class SIGITMAutomation:
                 final_name = f"{download.suggested_filename}"
                 final_path = self.download_dir / final_name
                 
-                await download.save_as(str(final_path))
-                self.logger.info(f"💾 Download salvo em: {final_path}")
+                try:
+                    await download.save_as(str(final_path))
+                    self.logger.info(f"💾 Download salvo em: {final_path}")
+
+                finally:
+                    # 6. Remove o artefato temporário do Playwright (mesmo se save_as falhar)
+                    await download.delete()
 
-                # 6. Integração com a sua lógica de validação
+                # 7. Integração com a sua lógica de validação
                 if await self._validate_downloaded_file(final_path):
                     self.logger.info("🎉 Exportação concluída e validada com sucesso!")
                     return final_path
                 
-                # 7. Fecha o download (libera memória)
-                await download.delete()
-                return None # Falhou na validação
+                # Falhou na validação: descarta o arquivo inválido
+                with contextlib.suppress(OSError):
+                    final_path.unlink()
+                return None
 
             except Exception as e:
                 self.logger.error(f"❌ Erro durante exportação: {e}")
@@ -592,59 +794,34 @@ class SIGITMAutomation:
         self.logger.info("⏳ Aguardando conclusão da consulta...")
         start_time = time.time()
 
-        async def check_completion():
-            
-            import re
-
-            try:
-                # 1. Verifica indicador de paginação
-                indicator = self.page.locator("div.my-paging-display.x-component:has-text('A visualizar'):visible")
-
-                if await indicator.count() == 0:
-                    return False, "indicator_not_found"
+        try:
+            # ⚡ Predicado avaliado no próprio browser: indicador de paginação visível com total > 0
+            total_handle = await self.page.wait_for_function(
+                _CONSULTA_TOTAL_JS,
+                timeout=timeout * 1000
+            )
 
-                text = (await indicator.first.text_content()).strip()
-                
-                # 2. Verifica se tem formato válido e dados
-                if "de" not in text or not any(c.isdigit() for c in text):
-                    return False, "invalid_format"
-                
-                # 3. Extrai total de registros
-                total_match = re.search(r'de\s+(\d+)', text)
-                if not total_match:
-                    return False, "no_total_found"
-                
-                total = int(total_match.group(1))
-                return total > 0, f"complete_{text}"
-            
-            except Exception as e:
-                return False, f"error_{str(e)[:50]}"
+            total = await total_handle.json_value()
+            elapsed = time.time() - start_time
+            self.logger.info("🎉 Consulta concluída em %.1fs (%s registros)", elapsed, total)
+            return True
         
-        # Estratégia de polling
-        check_count = 0
-        last_status = ""
-
-        while (time.time() - start_time) < timeout:
-            is_complete, status = await check_completion()
-            check_count += 1
-
-            if is_complete:
-                elapsed = time.time() - start_time
-                self.logger.info(f"🎉 Consulta concluída em {elapsed:.1f}s ({check_count} verificações)")
-                return True
-            
-            if status != last_status:
-                if ("complete" not in status and "error" not in status and status != "indicator_not_found"):
-                    self.logger.debug(f"📊 Status: {status}")
-                
-                last_status = status
-            
-            # Intervalo adaptativo (mais frequente no início)
-            await asyncio.sleep(1 if check_count < 10 else 2)
+        except PlaywrightTimeoutError:
+            self.logger.error(f"❌ Timeout após {timeout}s - Consulta sem resultados")
+            return False
         
-        self.logger.error(f"❌ Timeout após {timeout}s - Último status: {last_status}")
-        return False
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao aguardar a consulta: {e}")
+            return False
     
+    @staticmethod
+    def _file_size(file_path: Path) -> Optional[int]:
+        """Retorna o tamanho do arquivo em bytes ou None se ele não existir (um único stat)."""
+        try:
+            return file_path.stat().st_size
+        except FileNotFoundError:
+            return None
+
     async def _validate_downloaded_file(self, file_path: Path) -> bool:
         """
         Validação rápida do arquivo baixado.
@@ -657,11 +834,11 @@ class SIGITMAutomation:
         """
 
         try:
-            # Verificação básica
-            if not file_path.exists():
-                return False
+            # Verificação básica (stat em thread para não bloquear o event loop)
+            file_size = await asyncio.to_thread(self._file_size, file_path)
 
-            file_size = file_path.stat().st_size
+            if file_size is None:
+                return False
 
             if file_size == 0:
                 self.logger.warning("❌ Arquivo vazio")
@@ -679,35 +856,49 @@ class SIGITMAutomation:
         
         except Exception as e:
             self.logger.error(f"❌ Erro na validação: {e}")
+            return False
     
+    @staticmethod
+    def _has_excel_signature(file_path: Path) -> bool:
+        """
+        Verifica a assinatura do arquivo: OLE2 (.xls) ou ZIP com 'xl/workbook.xml' (.xlsx).
+        O ZipFile lê apenas o diretório central, no final do arquivo.
+        """
+        with file_path.open('rb') as file:
+            header = file.read(len(_XLS_MAGIC))
+
+        if header.startswith(_XLS_MAGIC):
+            return True
+
+        if header.startswith(_ZIP_MAGIC):
+            with zipfile.ZipFile(file_path) as archive:
+                return 'xl/workbook.xml' in archive.namelist()
+
+        return False
+
     async def _validate_excel(self, file_path: Path) -> bool:
         """
-        Validação rápida de Excel - verifica apenas se pode ser aberto.
+        Validação rápida de Excel - verifica apenas a assinatura do arquivo, sem carregar a planilha.
         """        
         try:
-            # Verificação leve - apenas tenta abrir o arquivo
-            import openpyxl
-
-            workbook = openpyxl.load_workbook(file_path, read_only=True)
-            has_sheets = len(workbook.sheetnames) > 0
-            workbook.close()
-
-            if not has_sheets:
-                self.logger.warning("❌ Excel sem planilhas")
+            if not await asyncio.to_thread(self._has_excel_signature, file_path):
+                self.logger.warning("❌ Arquivo sem assinatura de Excel válida")
                 return False
             
             self.logger.info("✅ Excel validado com sucesso")
             return True
         
-        except ImportError:
-            self.logger.warning("⚠️ Openpyxl não disponível - validação de Excel ignorada")
-            return True # Fallback
         except Exception as e:
             self.logger.error(f"❌ Excel corrompido ou inválido: {e}")
             return False
 
     async def execute_process_sigitm(self) -> Tuple[bool, Optional[Path]]:
 
+        # ⚡ Tarefas eager (Python 3.12+): gathers cujos filhos já concluíram não passam pelo loop
+        loop = asyncio.get_running_loop()
+        if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+            loop.set_task_factory(asyncio.eager_task_factory)
+
         try:
             if await self._login():
                 if await self._settings_consulta():
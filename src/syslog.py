@@ -1,7 +1,96 @@
+import atexit
 import logging
+import threading
 import warnings
 import sys
 from pathlib import Path
+from typing import Dict, Optional
+
+class BufferedFileHandler(logging.Handler):
+    """
+    Handler de arquivo com buffer em memória (64 KB por padrão).
+    
+    Agrupa os registros em poucas chamadas de write() em vez de uma por log. O buffer é
+    descarregado quando enche, em registros de nível ERROR ou superior, periodicamente
+    (flush_interval) e ao término do processo.
+    """
+
+    def __init__(self, filename: str, encoding: str = 'utf-8', buffer_size: int = 65536, flush_interval: float = 30.0):
+        super().__init__()
+        self.encoding = encoding
+        self.stream = open(filename, 'ab', buffering=buffer_size)
+        self._flush_interval = flush_interval
+        self._timer: Optional[threading.Timer] = None
+
+        self._schedule_flush()
+        atexit.register(self.flush)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_interval <= 0:
+            return
+
+        self._timer = threading.Timer(self._flush_interval, self._periodic_flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _periodic_flush(self) -> None:
+        self.flush()
+        if self.stream is not None:
+            self._schedule_flush()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # Sem o lock global do Handler: a formatação ocorre fora do lock (ver emit)
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = (self.format(record) + '\n').encode(self.encoding)
+
+            with self.lock:
+                if self.stream is None:
+                    return
+
+                self.stream.write(data)
+
+                # Erros vão para o disco imediatamente
+                if record.levelno >= logging.ERROR:
+                    self.stream.flush()
+
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.stream is not None and not self.stream.closed:
+                self.stream.flush()
+
+    def close(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+
+        with self.lock:
+            try:
+                if self.stream is not None:
+                    self.stream.flush()
+                    self.stream.close()
+            finally:
+                self.stream = None
+                super().close()
+
+# Ignora o aviso de estilos ausentes do openpyxl que polui o console (uma vez, na importação)
+warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+
+# Formato das mensagens de log, compartilhado por todos os handlers:
+#    - Adiciona o nome do módulo onde ocorreu o log
+#    - Inclui o caminho completo do arquivo para exceções
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s -  [%(filename)s:%(lineno)d] - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+
+# Um único handler por arquivo: loggers distintos compartilham o mesmo buffer (ordem preservada)
+_FILE_HANDLERS: Dict[Path, BufferedFileHandler] = {}
+_FILE_HANDLERS_LOCK = threading.Lock()
 
 class SystemLogger:
     
@@ -17,9 +106,6 @@ class SystemLogger:
         Returns:
             Objeto logger configurado
         """
-        # Ignora o aviso de estilos ausentes do openpyxl que polui o console
-        warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
-
         logger = logging.getLogger(name) # 1. Cria ou obtém um logger com o nome especificado
         logger.setLevel(logging.DEBUG) # 2. Define o nível mínimo de log (DEBUG captura tudo)
 
@@ -29,30 +115,25 @@ class SystemLogger:
 
         # 4. Cria o diretório de logs se não existir
         log_path = Path(log_file)
-        if not log_path.parent.exists():
-            log_path.parent.mkdir(parents=True)
+        if str(log_path.parent) not in ('', '.'):
+            log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 5. Configura o formato das mensagens de log:
-        #    - Adiciona o nome do módulo onde ocorreu o log
-        #    - Inclui o caminho completo do arquivo para exceções
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s -  [%(filename)s:%(lineno)d] - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+        # 5. Configura o handler (com buffer) para gravar em arquivo com UTF-8
+        handler_key = log_path.resolve()
 
-        # 6. Configura o handler para gravar em arquivo
-        # Configura o handler para gravar em arquivo com UTF-8
-        try:
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        
-        except TypeError:
-            # Fallback para versões mais antigas do Python que não suportam encoding no FileHandler
-            file_handler = logging.FileHandler(log_file)
-        
-        file_handler.setFormatter(formatter)
+        with _FILE_HANDLERS_LOCK:
+            file_handler = _FILE_HANDLERS.get(handler_key)
+
+            if file_handler is None:
+                file_handler = BufferedFileHandler(log_file, encoding='utf-8')
+                file_handler.setFormatter(_FORMATTER)
+                _FILE_HANDLERS[handler_key] = file_handler
 
-        # 7. Configura o handler para exibir no console com utf-8
+        # 6. Configura o handler para exibir no console com utf-8
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
 
-        # 8. Adiciona ambos handlers ao logger
+        # 7. Adiciona ambos handlers ao logger
         logger.addHandler(file_handler)
         logger.addHandler(console_handler)
 
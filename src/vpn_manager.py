@@ -1,7 +1,14 @@
+import contextlib
+import ctypes
 import subprocess
 import os
+import re
+import socket
+import struct
+import threading
 import time
-from typing import Optional, Tuple, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AbstractSet, Any, Callable, Optional, Tuple, Dict, FrozenSet, Iterable, Iterator, List
 from dataclasses import dataclass
 import pywinauto
 from pywinauto.application import WindowSpecification
@@ -9,7 +16,138 @@ from pywinauto.controls.uia_controls import ListItemWrapper
 from .syslog import SystemLogger
 from .psw import vpn_rj_name, vpn_rj_gateway, vpn_bh_name, vpn_bh_gateway, corporate_gateway, ssl_gateway
 
-@dataclass
+try:
+    import ahocorasick
+except ImportError: # pyahocorasick é opcional - sem ele a busca na saída textual usa regex
+    ahocorasick = None
+
+# Estruturas da IP Helper API (netioapi.h) para leitura direta da tabela de roteamento no Windows
+class _SOCKADDR_IN(ctypes.Structure):
+    _fields_ = [('sin_family', ctypes.c_uint16), ('sin_port', ctypes.c_uint16),
+                ('sin_addr', ctypes.c_ubyte * 4), ('sin_zero', ctypes.c_ubyte * 8)]
+
+class _SOCKADDR_IN6(ctypes.Structure):
+    _fields_ = [('sin6_family', ctypes.c_uint16), ('sin6_port', ctypes.c_uint16), ('sin6_flowinfo', ctypes.c_uint32),
+                ('sin6_addr', ctypes.c_ubyte * 16), ('sin6_scope_id', ctypes.c_uint32)]
+
+class _SOCKADDR_INET(ctypes.Union):
+    _fields_ = [('Ipv4', _SOCKADDR_IN), ('Ipv6', _SOCKADDR_IN6), ('si_family', ctypes.c_uint16)]
+
+class _IP_ADDRESS_PREFIX(ctypes.Structure):
+    _fields_ = [('Prefix', _SOCKADDR_INET), ('PrefixLength', ctypes.c_ubyte)]
+
+class _MIB_IPFORWARD_ROW2(ctypes.Structure):
+    _fields_ = [('InterfaceLuid', ctypes.c_uint64), ('InterfaceIndex', ctypes.c_uint32),
+                ('DestinationPrefix', _IP_ADDRESS_PREFIX), ('NextHop', _SOCKADDR_INET),
+                ('SitePrefixLength', ctypes.c_ubyte), ('ValidLifetime', ctypes.c_uint32),
+                ('PreferredLifetime', ctypes.c_uint32), ('Metric', ctypes.c_uint32), ('Protocol', ctypes.c_int),
+                ('Loopback', ctypes.c_ubyte), ('AutoconfigureAddress', ctypes.c_ubyte), ('Publish', ctypes.c_ubyte),
+                ('Immortal', ctypes.c_ubyte), ('Age', ctypes.c_uint32), ('Origin', ctypes.c_int)]
+
+class _MIB_IPFORWARD_TABLE2(ctypes.Structure):
+    _fields_ = [('NumEntries', ctypes.c_uint32), ('Table', _MIB_IPFORWARD_ROW2 * 1)]
+
+def _read_routes_win() -> FrozenSet[bytes]:
+    """
+    Lê a tabela de roteamento IPv4 via GetIpForwardTable2 (sem processo externo).
+    
+    Returns:
+        FrozenSet[bytes]: Endereços de destino e próximo salto, empacotados em 4 bytes
+    """
+    iphlpapi = ctypes.WinDLL('iphlpapi')
+    table = ctypes.c_void_p()
+
+    status = iphlpapi.GetIpForwardTable2(socket.AF_INET, ctypes.byref(table))
+    if status != 0:
+        raise OSError(status, "GetIpForwardTable2 falhou")
+
+    try:
+        count = _MIB_IPFORWARD_TABLE2.from_address(table.value).NumEntries
+        rows = (_MIB_IPFORWARD_ROW2 * count).from_address(table.value + _MIB_IPFORWARD_TABLE2.Table.offset)
+
+        addresses = set()
+        for row in rows:
+            addresses.add(bytes(row.DestinationPrefix.Prefix.Ipv4.sin_addr))
+            addresses.add(bytes(row.NextHop.Ipv4.sin_addr))
+        return frozenset(addresses)
+    
+    finally:
+        iphlpapi.FreeMibTable(table)
+
+# Callback de NotifyRouteChange2: (CallerContext, Row, NotificationType)
+_ROUTE_CHANGE_CALLBACK = getattr(ctypes, 'WINFUNCTYPE', ctypes.CFUNCTYPE)(
+    None, ctypes.c_void_p, ctypes.POINTER(_MIB_IPFORWARD_ROW2), ctypes.c_int
+)
+
+@contextlib.contextmanager
+def _route_change_notifier() -> Iterator[threading.Event]:
+    """
+    Evento sinalizado a cada mudança na tabela de rotas IPv4 (NotifyRouteChange2 no Windows).
+    Fora do Windows, ou se o registro falhar, o evento nunca é sinalizado e a espera equivale a um sleep.
+    
+    Yields:
+        threading.Event: Evento de mudança de rota
+    """
+    event = threading.Event()
+    handle = ctypes.c_void_p()
+    iphlpapi = None
+
+    if os.name == 'nt':
+        iphlpapi = ctypes.WinDLL('iphlpapi')
+        # Mantém a referência ao callback enquanto a notificação estiver registrada
+        callback = _ROUTE_CHANGE_CALLBACK(lambda context, row, notification_type: event.set())
+
+        if iphlpapi.NotifyRouteChange2(socket.AF_INET, callback, None, False, ctypes.byref(handle)) != 0:
+            iphlpapi = None
+
+    try:
+        yield event
+    finally:
+        if iphlpapi is not None:
+            iphlpapi.CancelMibChangeNotify2(handle)
+
+def _read_routes_proc() -> FrozenSet[bytes]:
+    """
+    Lê a tabela de roteamento IPv4 de /proc/net/route (Linux).
+    
+    Returns:
+        FrozenSet[bytes]: Endereços de destino e gateway, empacotados em 4 bytes
+    """
+    with open('/proc/net/route', 'rb') as f:
+        lines = f.read().splitlines()[1:]
+
+    addresses = set()
+    for line in lines:
+        fields = line.split()
+        # Campos em hexadecimal na ordem de bytes do host: Iface, Destination, Gateway, ...
+        addresses.add(struct.pack('=I', int(fields[1], 16)))
+        addresses.add(struct.pack('=I', int(fields[2], 16)))
+    return frozenset(addresses)
+
+def _make_gateway_matcher(pairs: Iterable[Tuple[Any, str]]) -> Callable[[AbstractSet], Optional[str]]:
+    """
+    Gera a função que devolve o rótulo do gateway de maior prioridade presente em um conjunto.
+    
+    Os pares (gateway, rótulo) ficam fixos no closure, sem consultas a atributos da instância
+    nem criação de geradores a cada verificação.
+    
+    Args:
+        pairs: Pares (gateway, rótulo) em ordem de prioridade
+        
+    Returns:
+        Callable: Função found -> rótulo ou None
+    """
+    pairs = tuple(pairs)
+
+    def match(found: AbstractSet) -> Optional[str]:
+        for gateway, label in pairs:
+            if gateway in found:
+                return label
+        return None
+
+    return match
+
+@dataclass(frozen=True, slots=True)
 class VPNConfig:
     """
     Configurações para gerenciamento de conexões VPN corporativas.
@@ -52,17 +190,14 @@ class VPNConfig:
         Raises:
             ValueError: Se qualquer parâmetro estiver inválido
         """
-        ip_fields = [
-            self.vpn_rj_gateway, 
-            self.vpn_bh_gateway, 
-            self.corporate_gateway,
-            self.ssl_gateway
-        ]
+        ip_fields = (self.vpn_rj_gateway, self.vpn_bh_gateway, self.corporate_gateway, self.ssl_gateway)
         
-        if not all(isinstance(attr, str) for attr in [self.vpn_rj_name, self.vpn_bh_name] + ip_fields):
-            raise ValueError("⚠️ Todos os parâmetros da VPN devem ser strings")
+        for value in (self.vpn_rj_name, self.vpn_bh_name, *ip_fields):
+            if not isinstance(value, str):
+                raise ValueError("⚠️ Todos os parâmetros da VPN devem ser strings")
         
-        for ip in ip_fields:
+        # Gateways repetidos (comum em configurações de teste) são validados uma única vez
+        for ip in set(ip_fields):
             if not self._is_valid_ip(ip):
                 raise ValueError(f"❌ IP inválido: {ip}")
 
@@ -75,14 +210,12 @@ class VPNConfig:
             ip: String contendo o endereço IP
             
         Returns:
-            bool: True se for um IPv4 válido, False caso contrário
+            bool: True se for um IPv4 válido, False caso contrário (formas com zeros à esquerda são rejeitadas)
         """
         try:
-            segments = ip.split('.')
-            if len(segments) != 4:
-                return False
-            return all(0 <= int(seg) <= 255 and seg == str(int(seg)) for seg in segments)
-        except ValueError:
+            socket.inet_pton(socket.AF_INET, ip)
+            return True
+        except OSError:
             return False
 
 class VPNConnectionManager:
@@ -110,13 +243,156 @@ class VPNConnectionManager:
         """        
         self.config = config
         self._os_type = 'nt' if os.name == 'nt' else 'posix'
-        self._route_command = 'route print' if self._os_type == 'nt' else 'ip route'
-        self._vpn_settings_command = ["start", "ms-settings:network-vpn"]
+        self._route_command = ['route', 'print'] if self._os_type == 'nt' else ['ip', 'route']
+        self._vpn_settings_uri = "ms-settings:network-vpn"
         self.logger = SystemLogger.configure_logger("VPNManager")
         self._last_status_check = 0
         self._status_cache = None
         self._cache_timeout = 5
         self._current_vpn = None
+        # Resultados de window.descendants() por (janela, tipo de controle), válidos até o próximo clique
+        self._uia_cache: Dict[Tuple[int, str], list] = {}
+        # Thread única para ações de UI em segundo plano (ex.: desconectar VPN errada); mantém a ordem das ações
+        self._ui_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vpn-ui")
+        self._pending_ui: Optional[Future] = None
+        # Itens da lista de VPNs já localizados por (janela, nome da VPN)
+        self._vpn_item_cache: Dict[Tuple[int, str], ListItemWrapper] = {}
+        # Gateway -> rótulo, na ordem de prioridade da verificação (setdefault: IP repetido mantém o primeiro rótulo)
+        self._gateway_map: Dict[str, str] = {}
+        for ip, label in ((config.corporate_gateway, 'corporate'), (config.ssl_gateway, 'ssl'),
+                          (config.vpn_rj_gateway, 'rj'), (config.vpn_bh_gateway, 'bh')):
+            self._gateway_map.setdefault(ip, label)
+
+        # Gateways empacotados (4 bytes) para a leitura direta da tabela de rotas
+        self._gateway_packed = tuple((socket.inet_aton(ip), label) for ip, label in self._gateway_map.items())
+        # Seletores especializados no conjunto fixo de gateways (gerados uma vez por instância)
+        self._match_packed = _make_gateway_matcher(self._gateway_packed)
+        self._match_ip = _make_gateway_matcher(self._gateway_map.items())
+        # Uma única expressão para localizar todos os gateways na saída textual em uma passada.
+        # As bordas impedem que um IP case dentro de outro (ex.: 10.1.1.1 em 10.1.1.10)
+        # Padrão em bytes: a saída do comando é varrida sem decodificação
+        self._gateway_pattern = re.compile(
+            rb'(?<![\d.])(?:' + b'|'.join(re.escape(ip.encode()) for ip in sorted(self._gateway_map, key=len, reverse=True)) + rb')(?!\.?\d)'
+        )
+        self._gateway_automaton = None
+
+        if ahocorasick is not None:
+            self._gateway_automaton = ahocorasick.Automaton()
+            for ip in self._gateway_map:
+                self._gateway_automaton.add_word(ip, ip)
+            self._gateway_automaton.make_automaton()
+
+    def _descendants(self, window: WindowSpecification, control_type: Optional[str] = None) -> list:
+        """
+        Retorna os descendentes da janela de um tipo de controle, reaproveitando a última varredura UIA.
+        
+        Args:
+            window: Janela de configurações
+            control_type: Tipo de controle UIA (ex.: 'Button', 'ListItem'); None retorna todos
+            
+        Returns:
+            list: Elementos encontrados (em ordem de documento)
+        """
+        key = (id(window), control_type)
+        if key not in self._uia_cache:
+            self._uia_cache[key] = window.descendants(control_type=control_type) if control_type else window.descendants()
+        return self._uia_cache[key]
+
+    def _invalidate_uia_cache(self) -> None:
+        """Descarta as varreduras UIA em cache (a interface mudou)."""
+        self._uia_cache.clear()
+
+    def _click(self, element) -> None:
+        """Clica no elemento e invalida o cache UIA, já que o clique altera a interface."""
+        element.click_input()
+        self._invalidate_uia_cache()
+
+    def _find_gateways_in_text(self, output: bytes) -> set:
+        """
+        Localiza os gateways configurados na saída textual do comando de rotas em uma única passada.
+        
+        Args:
+            output: Saída do comando de rotas (bytes, sem decodificação)
+            
+        Returns:
+            set: IPs de gateway encontrados (apenas ocorrências completas, não substrings de outro IP)
+        """
+        if self._gateway_automaton is None:
+            return {match.decode() for match in set(self._gateway_pattern.findall(output))}
+
+        # O automato opera sobre str: latin-1 mapeia byte a byte, sem validação (os IPs são ASCII)
+        output = output.decode('latin-1')
+
+        found = set()
+        for end, ip in self._gateway_automaton.iter(output):
+            start = end - len(ip) + 1
+            before = output[start - 1:start]
+            after = output[end + 1:end + 3]
+
+            # Descarta ocorrências coladas a outros dígitos/octetos
+            if before.isdigit() or before == '.' or after[:1].isdigit() or (after[:1] == '.' and after[1:2].isdigit()):
+                continue
+            found.add(ip)
+        return found
+
+    def _scan_route_command(self, timeout: int = 5) -> set:
+        """
+        Executa o comando de rotas e varre a saída linha a linha, à medida que é produzida.
+        Encerra o processo assim que o gateway de maior prioridade aparece.
+        
+        Args:
+            timeout: Tempo máximo de execução do comando em segundos
+            
+        Returns:
+            set: IPs de gateway encontrados
+            
+        Raises:
+            subprocess.TimeoutExpired: Se o comando exceder o timeout
+            subprocess.CalledProcessError: Se o comando terminar com erro
+        """
+        found = set()
+        top_priority = next(iter(self._gateway_map))
+        timed_out = threading.Event()
+
+        with subprocess.Popen(self._route_command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+
+            def _kill_on_timeout():
+                timed_out.set()
+                proc.kill()
+
+            killer = threading.Timer(timeout, _kill_on_timeout)
+            killer.start()
+
+            try:
+                for line in proc.stdout:
+                    found |= self._find_gateways_in_text(line)
+
+                    if top_priority in found:
+                        proc.kill() # Resultado já definido: não lê o restante da tabela
+                        return found
+            finally:
+                killer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(self._route_command, timeout)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, self._route_command)
+        
+        return found
+
+    def _read_route_addresses(self) -> Optional[FrozenSet[bytes]]:
+        """
+        Lê os endereços da tabela de roteamento direto do sistema operacional.
+        
+        Returns:
+            FrozenSet[bytes]: Endereços empacotados ou None se a leitura direta não estiver disponível
+        """
+        try:
+            return _read_routes_win() if self._os_type == 'nt' else _read_routes_proc()
+        
+        except (OSError, AttributeError, ValueError, IndexError) as e:
+            self.logger.debug(f"Leitura direta da tabela de rotas indisponível: {e}")
+            return None
 
     def _get_active_gateway(self, force_check: bool = False) -> Optional[str]:
         """
@@ -130,34 +406,25 @@ class VPNConnectionManager:
         """
         if not force_check and time.time() - self._last_status_check < self._cache_timeout:
             return self._status_cache
-            
+
+        # ⚡ Caminho principal: tabela de rotas lida via API do sistema (sem shell/processo)
+        addresses = self._read_route_addresses()
+        if addresses is not None:
+            self._status_cache = self._match_packed(addresses)
+            self._last_status_check = time.time()
+            return self._status_cache
+
+        # Fallback: saída textual do comando de rotas
         try:
-            result = subprocess.run(
-                self._route_command,
-                shell=True,
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            output = result.stdout
-            if self.config.corporate_gateway in output:
-                self._status_cache = 'corporate'
-            elif self.config.ssl_gateway in output:
-                self._status_cache = 'ssl'
-            elif self.config.vpn_rj_gateway in output:
-                self._status_cache = 'rj'
-            elif self.config.vpn_bh_gateway in output:
-                self._status_cache = 'bh'
-            else:
-                self._status_cache = None
+            # A prioridade é aplicada sobre os gateways encontrados
+            found = self._scan_route_command()
+            self._status_cache = self._match_ip(found)
                 
             self._last_status_check = time.time()
             return self._status_cache
             
-        except subprocess.SubprocessError as e:
-            self.logger.warning(f"❌ Erro ao verificar gateway: {e.stderr or str(e)}")
+        except (subprocess.SubprocessError, OSError) as e:
+            self.logger.warning(f"❌ Erro ao verificar gateway: {e}")
             return None
 
     def connect_with_fallback(self) -> Tuple[bool, str]:
@@ -216,7 +483,12 @@ class VPNConnectionManager:
                 
         for attempt in range(1, self.config.max_retries + 1):
             try:
-                # Verificação rápida antes de tentar
+                # Conclui desconexões em segundo plano antes de ler a tabela de rotas: uma VPN
+                # errada ainda ativa não pode ser tomada como conexão já estabelecida
+                self._wait_pending_ui()
+
+                # Verificação rápida antes de tentar, sempre na tabela de rotas atual: a VPN
+                # pode ter subido durante o intervalo entre tentativas
                 if self._get_active_gateway(force_check=True) == expected_gateway:
                     self._update_current_vpn(expected_gateway)
                     return True, f"Já conectado à {vpn_name}"
@@ -248,6 +520,10 @@ class VPNConnectionManager:
             bool: True se a tentativa foi bem-sucedida
         """
         try:
+            # Conclui a desconexão/fechamento pendente da tentativa anterior antes de reabrir a janela
+            self._wait_pending_ui()
+            self._invalidate_uia_cache()
+            self._vpn_item_cache.clear()
             self.logger.debug("Abrindo janela de configurações...")
             window = self._open_vpn_settings_window()
             if not window:
@@ -261,9 +537,13 @@ class VPNConnectionManager:
                 window.close()
                 return False
 
-            # Tenta conectar
-            if not self._click_connect_button(window, vpn_name):
-                window.close()
+            # Tenta conectar (reaproveitando o item já localizado)
+            if not self._click_connect_button(window, vpn_name, vpn_item):
+                if self._pending_ui is not None:
+                    # Desconexão em andamento: fecha a janela na mesma thread, logo após ela
+                    self._pending_ui = self._ui_executor.submit(window.close)
+                else:
+                    window.close()
                 return False
 
             window.close()
@@ -274,6 +554,25 @@ class VPNConnectionManager:
             return False
 
     def _find_vpn_in_list(self, window: WindowSpecification, vpn_name: str) -> Optional[ListItemWrapper]:
+        """
+        Localiza a VPN na lista, reaproveitando o item já encontrado para a mesma janela.
+        
+        Args:
+            window: Janela de configurações
+            vpn_name: Nome da VPN a ser encontrada
+            
+        Returns:
+            ListItemWrapper: Item da VPN encontrado ou None
+        """
+        key = (id(window), vpn_name)
+        if key not in self._vpn_item_cache:
+            item = self._search_vpn_in_list(window, vpn_name)
+            if item is None:
+                return None
+            self._vpn_item_cache[key] = item
+        return self._vpn_item_cache[key]
+
+    def _search_vpn_in_list(self, window: WindowSpecification, vpn_name: str) -> Optional[ListItemWrapper]:
         """
         Localiza a VPN na lista de conexões usando múltiplas estratégias.
         
@@ -309,8 +608,9 @@ class VPNConnectionManager:
                     control_type="List",
                     timeout=self.config.ui_load_timeout
                 )
+                wanted = vpn_name.lower()
                 for idx, item in enumerate(vpn_list.children()):
-                    if vpn_name.lower() in item.window_text().lower():
+                    if wanted in item.window_text().lower():
                         self.logger.debug(f"✅ VPN encontrada via busca iterativa (item {idx + 1})")
                         return item
             except Exception as e:
@@ -322,7 +622,7 @@ class VPNConnectionManager:
             self.logger.error(f"Erro ao localizar VPN: {str(e)}")
             return None
 
-    def _click_connect_button(self, window: WindowSpecification, vpn_name: str) -> bool:
+    def _click_connect_button(self, window: WindowSpecification, vpn_name: str, vpn_item: ListItemWrapper) -> bool:
         """
         Tenta clicar no botão 'Conectar' usando apenas:
         1. Botão Conectar específico
@@ -331,6 +631,7 @@ class VPNConnectionManager:
         Args:
             window: Janela de configurações
             vpn_name: Nome da VPN para contexto
+            vpn_item: Item da VPN já localizado por _find_vpn_in_list
             
         Returns:
             bool: True se o clique foi bem-sucedido
@@ -338,22 +639,16 @@ class VPNConnectionManager:
         self.logger.debug(f"⌛ Tentando conectar a VPN: {vpn_name}")
 
         try:
-            # Primeiro localiza o item correto da VPN
-            vpn_item = self._find_vpn_in_list(window, vpn_name)
-            if not vpn_item:
-                self.logger.error(f"❌ Item da VPN {vpn_name} não encontrado")
-                return False
-
             # Abordagem 1: Botão Conectar específico
             try:
                 # Clica no item primeiro para garantir foco
-                vpn_item.click_input()
+                self._click(vpn_item)
                 time.sleep(2)
 
                 # Tenta encontrar o botão Conectar
                 connect_button = self._find_connect_button(window)
                 if connect_button:
-                    connect_button.click_input()
+                    self._click(connect_button)
                     time.sleep(3)
 
                     if self._verify_connection_success(window, vpn_name):
@@ -364,17 +659,15 @@ class VPNConnectionManager:
 
             # Abordagem 2: Busca global
             try:
-                # Encontra todos os botões "Conectar"
-                connect_buttons = [
-                    btn for btn in window.descendants(control_type="Button") if "Conectar" in btn.window_text()
-                ]
+                # Encontra todos os botões "Conectar" já associados ao texto do item que os contém
+                connect_buttons = self._find_connect_buttons(window)
                 
                 if connect_buttons:
                     # Tenta encontrar o botão associado à VPN correta
-                    for btn in connect_buttons:
+                    for btn, owner_text in connect_buttons:
                         try:
-                            if vpn_name in btn.parent().window_text():
-                                btn.click_input()
+                            if vpn_name in owner_text:
+                                self._click(btn)
                                 time.sleep(3)
 
                                 if self._verify_connection_success(window, vpn_name):
@@ -384,7 +677,7 @@ class VPNConnectionManager:
                             continue
                     
                     # Fallback: clica no primeiro botão Conectar
-                    connect_buttons[0].click_input()
+                    self._click(connect_buttons[0][0])
                     time.sleep(3)
 
                     if self._verify_connection_success(window, vpn_name):
@@ -394,7 +687,8 @@ class VPNConnectionManager:
                         # Verifica se conectou em outra VPN por engano
                         active_vpn = self._get_active_vpn_name(window)
                         if active_vpn and active_vpn != vpn_name:
-                            self._disconnect_vpn(window, active_vpn)
+                            # Desconecta em segundo plano: a espera entre tentativas corre em paralelo
+                            self._pending_ui = self._ui_executor.submit(self._disconnect_vpn, window, active_vpn)
             except Exception as e:
                 self.logger.debug(f"❌ Erro durante busca global: {str(e)}")
 
@@ -405,6 +699,35 @@ class VPNConnectionManager:
             self.logger.error(f"❌ Erro crítico durante conexão: {str(e)}", exc_info=True)
             return False
         
+    def _find_connect_buttons(self, window: WindowSpecification) -> List[Tuple[Any, str]]:
+        """
+        Localiza os botões 'Conectar' junto com o texto do item da lista que os precede.
+        
+        Uma única varredura UIA (todos os descendentes, em ordem de documento): cada botão é
+        associado ao último ListItem visto antes dele, em vez de uma chamada parent() por botão.
+        
+        Args:
+            window: Janela de configurações
+            
+        Returns:
+            List[Tuple[Any, str]]: Pares (botão, texto do item); texto vazio se nenhum item o precede
+        """
+        buttons = []
+        owner_text = ""
+
+        for element in self._descendants(window):
+            try:
+                control_type = element.element_info.control_type
+
+                if control_type == "ListItem":
+                    owner_text = element.window_text()
+                elif control_type == "Button" and "Conectar" in element.window_text():
+                    buttons.append((element, owner_text))
+            except Exception:
+                continue
+
+        return buttons
+
     def _find_connect_button(self, window: WindowSpecification) -> Optional[WindowSpecification]:
         """Tenta encontrar o botão Conectar usando múltiplas estratégias."""
         try:
@@ -438,11 +761,12 @@ class VPNConnectionManager:
     def _get_active_vpn_name(self, window: WindowSpecification) -> Optional[bool]:
         """Obtém o nome da VPN que está atualmente conectada."""
         try:
-            connected_items = window.descendants(control_type="ListItem")
+            connected_items = self._descendants(window, "ListItem")
             for item in connected_items:
                 try:
-                    if "Desconectar" in item.window_text():
-                        return item.window_text().replace("Desconectar", "").strip()
+                    text = item.window_text() # Uma única leitura UIA por item
+                    if "Desconectar" in text:
+                        return text.replace("Desconectar", "").strip()
                 except:
                     continue
             return None
@@ -462,7 +786,8 @@ class VPNConnectionManager:
                 control_type="Button",
                 timeout=5
             )
-            disconnect_button.click_input()
+            self._click(disconnect_button)
+            self._vpn_item_cache.clear()
             time.sleep(3)
             self.logger.info(f"ℹ️ VPN {vpn_name} desconectada")
             return True
@@ -470,6 +795,38 @@ class VPNConnectionManager:
             self.logger.error(f"❌ Falha ao desconectar {vpn_name}: {str(e)}")
             return False
 
+    def _wait_for_gateway(self, expected_gateway: str, timeout: float) -> bool:
+        """
+        Aguarda o gateway esperado aparecer na tabela de rotas.
+        
+        Deixa o cache de status preenchido com a última leitura, de modo que a próxima
+        verificação sem force_check não consulta a tabela de novo.
+        
+        Args:
+            expected_gateway: Gateway esperado ('rj' ou 'bh')
+            timeout: Tempo máximo de espera em segundos
+            
+        Returns:
+            bool: True se o gateway ficou ativo dentro do timeout
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+
+        # ⚡ Backoff exponencial (0.05s → 1s); no Windows a mudança de rota acorda a espera na hora
+        with _route_change_notifier() as route_changed:
+            while True:
+                if self._get_active_gateway(force_check=True) == expected_gateway:
+                    self._update_current_vpn(expected_gateway)
+                    return True
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+
+                route_changed.wait(min(delay, remaining))
+                route_changed.clear()
+                delay = min(delay * 2, 1.0)
+
     def _verify_vpn_connection(self, expected_gateway: str) -> bool:
         """
         Verifica se a VPN está realmente conectada após a tentativa.
@@ -480,16 +837,33 @@ class VPNConnectionManager:
         Returns:
             bool: True se a conexão foi verificada
         """
-        start_time = time.time()
-        while time.time() - start_time < self.config.vpn_switch_timeout:
-            if self._get_active_gateway(force_check=True) == expected_gateway:
-                self._update_current_vpn(expected_gateway)
-                return True
-            time.sleep(3)
+        if self._wait_for_gateway(expected_gateway, self.config.vpn_switch_timeout):
+            return True
         
         self.logger.warning("❌ Falha ao verificar conexão dentro do timeout")
         return False
 
+    def _wait_pending_ui(self) -> None:
+        """
+        Aguarda a conclusão das ações de UI em segundo plano (falhas já são registradas por elas).
+        Como essas ações alteram as conexões, o cache de rotas é invalidado em seguida.
+        """
+        if self._pending_ui is None:
+            return
+
+        try:
+            self._pending_ui.result()
+        except Exception as e:
+            self.logger.debug(f"Ação de UI em segundo plano falhou: {e}")
+        finally:
+            self._pending_ui = None
+            self._last_status_check = 0
+
+    def close(self) -> None:
+        """Aguarda ações de UI pendentes e encerra a thread de segundo plano."""
+        self._ui_executor.shutdown(wait=True)
+        self._pending_ui = None
+
     def _update_current_vpn(self, gateway: Optional[str]) -> None:
         """
         Atualiza o estado interno da VPN atual.
@@ -512,22 +886,18 @@ class VPNConnectionManager:
             WindowSpecification: Objeto da janela ou None se falhar
         """
         try:
-            subprocess.run(
-                self._vpn_settings_command,
-                shell=True,
-                check=True,
-                timeout=10
-            )
-            time.sleep(3)  # Tempo para a janela carregar
+            # ShellExecute direto (sem cmd.exe)
+            os.startfile(self._vpn_settings_uri)
             
-            # Tenta encontrar a janela com vários identificadores
+            # Aguarda a janela aparecer (pt-BR ou inglês), retornando assim que existir
             desktop = pywinauto.Desktop(backend="uia")
-            try:
-                window = desktop["Configurações de VPN"]
-                return window
-            except:
-                window = desktop["VPN settings"]
-                return window
+            candidates = (desktop.window(best_match="Configurações de VPN"), desktop.window(best_match="VPN settings"))
+
+            pywinauto.timings.wait_until(
+                self.config.ui_load_timeout, 0.1,
+                lambda: any(window.exists(timeout=0) for window in candidates)
+            )
+            return next(window for window in candidates if window.exists(timeout=0))
             
         except Exception as e:
             self.logger.error(f"Falha ao abrir interface VPN: {str(e)}")